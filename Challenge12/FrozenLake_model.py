@@ -0,0 +1,108 @@
+import numpy as np
+
+# ── ARRAY-BACKED DYNA-Q MODEL ────────────────────────────────────────────────
+# Seen (s, a) pairs live in preallocated arrays, with index[s, a] pointing at
+# their slot (-1 = unseen): insert/overwrite and uniform sampling are O(1),
+# and a whole planning phase is a handful of NumPy calls instead of
+# PLANNING_STEPS Python-level updates over a rebuilt list of dict keys.
+class DynaModel:
+    def __init__(self, nS, nA, rng=None):
+        self.index       = np.full((nS, nA), -1, dtype=np.int64)
+        self.states      = np.empty(nS * nA, dtype=np.int64)
+        self.actions     = np.empty(nS * nA, dtype=np.int64)
+        self.next_states = np.empty(nS * nA, dtype=np.int64)
+        self.rewards     = np.empty(nS * nA)
+        self.size        = 0
+        self.updates     = 0       # planning updates applied so far
+        self.rng         = rng or np.random.default_rng()
+
+    def __len__(self):
+        return self.size
+
+    def add(self, s, a, s2, r):
+        """Record (or overwrite) the observed outcome of taking a in s."""
+        i = self.index[s, a]
+        if i < 0:
+            i = self.index[s, a] = self.size
+            self.states[i], self.actions[i] = s, a
+            self.size += 1
+        self.next_states[i], self.rewards[i] = s2, r
+
+    def sample(self, k):
+        """k slots drawn uniformly (with replacement) from the seen pairs."""
+        return self.rng.integers(0, self.size, size=k)
+
+    def plan(self, Q, alpha, gamma, steps):
+        """
+        Apply `steps` sampled planning updates in one batch.  Targets come
+        from the Q snapshot at the start of the batch; a pair drawn c times
+        gets the c sequential updates toward that target in closed form,
+        Q += (1 - (1 - alpha)^c) * (target - Q).
+        """
+        if self.size == 0 or steps <= 0:
+            return
+        slots, counts = np.unique(self.sample(steps), return_counts=True)
+        self.updates += steps
+        self._apply(Q, alpha, gamma, slots, counts)
+
+    def _apply(self, Q, alpha, gamma, slots, counts=1):
+        """Batched update of distinct `slots`; returns their states."""
+        s, a = self.states[slots], self.actions[slots]
+        target = self.rewards[slots] + gamma * Q[self.next_states[slots]].max(axis=1)
+        Q[s, a] += (1.0 - (1.0 - alpha) ** counts) * (target - Q[s, a])
+        return s
+
+
+# ── PRIORITIZED SWEEPING ─────────────────────────────────────────────────────
+# Same storage, but each planning batch takes the (up to) `steps` pairs with
+# the largest TD error instead of a uniform sample, then re-queues the
+# predecessors of every state it changed, so value changes propagate
+# backwards from the goal instead of being found by chance.  Priorities
+# live in a per-slot array (0 = not queued): picking the batch is one
+# argpartition, the update is DynaModel's batched _apply, and re-queuing
+# is one vectorised TD-error pass, so no Python-level heap work is done
+# per pair.  A change therefore reaches one more predecessor per plan()
+# call (real step) rather than within the call.
+class PrioritizedModel(DynaModel):
+    def __init__(self, nS, nA, theta=1e-3, rng=None):
+        super().__init__(nS, nA, rng)
+        self.theta    = theta                      # smallest priority worth queuing
+        self.priority = np.zeros(nS * nA)          # slot -> queued |TD error|
+        self.preds    = [[] for _ in range(nS)]    # state -> slots that lead into it
+        self.pending  = []                         # slots added since the last plan()
+
+    def add(self, s, a, s2, r):
+        i = int(self.index[s, a])
+        if i < 0:
+            self.preds[s2].append(self.size)
+        elif self.next_states[i] != s2:
+            self.preds[int(self.next_states[i])].remove(i)
+            self.preds[s2].append(i)
+        super().add(s, a, s2, r)
+        self.pending.append(int(self.index[s, a]))
+
+    def _queue(self, slots, Q, gamma):
+        """Raise the priority of `slots` to their current |TD error|."""
+        td = np.abs(self.rewards[slots] + gamma * Q[self.next_states[slots]].max(axis=1)
+                    - Q[self.states[slots], self.actions[slots]])
+        self.priority[slots] = np.maximum(self.priority[slots], td)
+
+    def plan(self, Q, alpha, gamma, steps):
+        """Up to `steps` updates of the highest-priority pairs; none once nothing exceeds theta."""
+        if self.size == 0 or steps <= 0:
+            return
+        if self.pending:
+            self._queue(np.array(self.pending), Q, gamma)
+            self.pending.clear()
+        priority = self.priority[:self.size]
+        slots = np.flatnonzero(priority > self.theta)
+        if slots.size == 0:
+            return
+        if slots.size > steps:
+            slots = slots[np.argpartition(priority[slots], -steps)[-steps:]]
+        priority[slots] = 0.0
+        self.updates += slots.size
+        states = self._apply(Q, alpha, gamma, slots)
+        preds = [j for s in set(states.tolist()) for j in self.preds[s]]
+        if preds:
+            self._queue(np.array(preds), Q, gamma)
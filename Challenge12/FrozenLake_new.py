@@ -1,9 +1,11 @@
 import time
 import numpy as np
 import gym
-import random
 from gym.envs.toy_text.frozen_lake import generate_random_map
 
+from FrozenLake_tables import compile_map, validate_against_gym
+from FrozenLake_train import train_dyna_q
+
 # ── PATCH NUMPY FOR GYM COMPATIBILITY ────────────────────────────────────────
 if not hasattr(np, 'bool8'):
     setattr(np, 'bool8', np.bool_)
@@ -20,81 +22,29 @@ EPS_START       = 1.0              # initial exploration
 EPS_END         = 0.01             # final exploration
 PLANNING_STEPS  = 20               # Dyna‑Q planning per real step
 STEP_PENALTY    = 0.001            # small penalty to encourage shortest paths
-
-EPS_DECAY = (EPS_START - EPS_END) / EPISODES
+USE_TABLES      = True             # step through compiled tables instead of env.step
+PLANNER         = "uniform"        # "uniform" Dyna-Q replay or "prioritized" sweeping
+PS_THETA        = 1e-3             # prioritized sweeping: smallest TD error worth queuing
 
 # ── GENERATE ONE FIXED MAP ───────────────────────────────────────────────────
 RANDOM_MAP = generate_random_map(size=SIZE, p=FREEZE_P)
 
-# ── HELPER FUNCTIONS ─────────────────────────────────────────────────────────
-def q_update(Q, s, a, s2, r):
-    best_next = np.argmax(Q[s2])
-    Q[s, a] += ALPHA * (r + GAMMA * Q[s2, best_next] - Q[s, a])
-
-def planning_update(Q, s, a, s2, r):
-    best_n = np.argmax(Q[s2])
-    Q[s, a] += ALPHA * (r + GAMMA * Q[s2, best_n] - Q[s, a])
-
 # ── TRAINING & PROFILING ──────────────────────────────────────────────────────
 def train_and_profile():
-    env = gym.make("FrozenLake-v1", desc=RANDOM_MAP, is_slippery=False)
-    nS, nA = env.observation_space.n, env.action_space.n
-    Q     = np.zeros((nS, nA))
-    model = {}
-
-    time_q_update = 0.0
-    time_planning = 0.0
-
-    for ep in range(EPISODES):
-        state = env.reset()
-        if isinstance(state, tuple):
-            state = state[0]
-        done = False
-        eps  = max(EPS_END, EPS_START - EPS_DECAY * ep)
-
-        while not done:
-            # choose action
-            if np.random.rand() < eps:
-                action = env.action_space.sample()
-            else:
-                action = int(np.argmax(Q[state]))
-
-            # take step
-            out = env.step(action)
-            if len(out) == 5:
-                nxt, reward, term, trunc, _ = out
-                done = term or trunc
-            else:
-                nxt, reward, done, _ = out
-
-            # penalize falling in hole
-            if done and reward == 0:
-                reward = -1.0
-            # step penalty
-            reward -= STEP_PENALTY
-
-            # time the Q‑update
-            t0 = time.perf_counter()
-            q_update(Q, state, action, nxt, reward)
-            time_q_update += time.perf_counter() - t0
-
-            # update model and do Dyna‑Q planning
-            model[(state, action)] = (nxt, reward)
-            for _ in range(PLANNING_STEPS):
-                s_p, a_p = random.choice(list(model.keys()))
-                s2_p, r2_p = model[(s_p, a_p)]
-                t1 = time.perf_counter()
-                planning_update(Q, s_p, a_p, s2_p, r2_p)
-                time_planning += time.perf_counter() - t1
-
-            state = nxt
-
-        # progress indicator
-        if (ep + 1) % 5000 == 0:
-            print(f"  Trained {ep+1}/{EPISODES} episodes")
-
-    env.close()
-    return Q, time_q_update, time_planning
+    tables, env = None, None
+    if USE_TABLES:
+        tables = compile_map(RANDOM_MAP)
+        validate_against_gym(RANDOM_MAP, tables)
+    else:
+        env = gym.make("FrozenLake-v1", desc=RANDOM_MAP, is_slippery=False)
+
+    # -1 for falling in a hole (or running out of steps), plus a step penalty
+    Q, _, stats = train_dyna_q(tables, EPISODES, ALPHA, GAMMA, PLANNING_STEPS, PLANNER,
+                               PS_THETA, EPS_START, EPS_END, step_penalty=STEP_PENALTY,
+                               fail_reward=-1.0, env=env, progress_every=5000)
+    if env is not None:
+        env.close()
+    return Q, stats["timing"]["update_s"], stats["timing"]["planning_s"]
 
 # ── EVALUATION ────────────────────────────────────────────────────────────────
 def evaluate(Q):
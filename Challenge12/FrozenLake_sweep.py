@@ -0,0 +1,208 @@
+import argparse
+import itertools
+import json
+import os
+import random
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from gym.envs.toy_text.frozen_lake import generate_random_map
+
+from FrozenLake_tables import compile_map
+from FrozenLake_train import greedy_success, train_dyna_q
+
+# ── SWEEP CONFIGURATION ──────────────────────────────────────────────────────
+# Grid search takes the cartesian product of GRID; random search draws
+# SAMPLES configs from RANDOM_SPACE (tuple = uniform range, list = choices).
+# Configs with planning_steps = 0 run once, with planner "none".
+# Everything else follows FrozenLake_new.py.
+GRID = {
+    "size":           [15],
+    "alpha":          [0.05, 0.1, 0.3],
+    "gamma":          [0.95, 0.99],
+    "episodes":       [2_000, 5_000],
+    "planning_steps": [0, 5, 20],
+    "planner":        ["uniform", "prioritized"],
+    "map_seed":       [0, 1, 2],
+}
+RANDOM_SPACE = {
+    "size":           [15],
+    "alpha":          (0.02, 0.5),
+    "gamma":          (0.9, 0.999),
+    "episodes":       [1_000, 2_000, 5_000],
+    "planning_steps": [0, 5, 10, 20, 50],
+    "planner":        ["uniform", "prioritized"],
+    "map_seed":       list(range(10)),
+}
+SAMPLES         = 64               # random-search draws
+HOLE_PROB       = 0.2              # 20% holes
+EPS_START       = 1.0              # initial exploration
+EPS_END         = 0.01             # final exploration
+STEP_PENALTY    = 0.001            # small penalty to encourage shortest paths
+PS_THETA        = 1e-3             # prioritized sweeping threshold
+CHECK_EVERY     = 50               # episodes between greedy convergence checks
+RESULTS         = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sweep_results.jsonl")
+
+# ── CONFIG GENERATION ────────────────────────────────────────────────────────
+def normalize(cfg):
+    """Without planning steps the planner is never used: record it as "none"."""
+    if cfg["planning_steps"] == 0:
+        cfg["planner"] = "none"
+    return cfg
+
+def _unique(configs):
+    """Drop repeated configs, keeping the first of each."""
+    out, seen = [], set()
+    for cfg in configs:
+        key = config_key(cfg)
+        if key not in seen:
+            seen.add(key)
+            out.append(cfg)
+    return out
+
+def grid_configs(grid=GRID):
+    keys = list(grid)
+    return _unique(normalize(dict(zip(keys, values)))
+                   for values in itertools.product(*(grid[k] for k in keys)))
+
+def random_configs(samples=SAMPLES, seed=0, space=RANDOM_SPACE):
+    """Reproducible from seed, so an interrupted random sweep resumes the same draws."""
+    rng = random.Random(seed)
+    configs = []
+    for _ in range(samples):
+        cfg = {}
+        for k, v in space.items():
+            cfg[k] = round(rng.uniform(*v), 4) if isinstance(v, tuple) else rng.choice(v)
+        configs.append(normalize(cfg))
+    return _unique(configs)
+
+def config_key(cfg):
+    return json.dumps(cfg, sort_keys=True)
+
+def run_seed(cfg, base_seed=0):
+    """Per-run seed derived from the config itself: stable across resumes and worker order."""
+    return zlib.crc32(config_key(cfg).encode()) ^ base_seed
+
+# ── ONE TRAINING RUN (worker side) ───────────────────────────────────────────
+def make_map(size, map_seed):
+    np.random.seed(map_seed)  # generate_random_map draws from the global RNG
+    return generate_random_map(size=size, p=1 - HOLE_PROB)
+
+def run_config(cfg, seed):
+    """
+    Table-driven Dyna-Q with FrozenLake_new.py's reward shaping and
+    epsilon schedule, through the shared train_dyna_q loop.
+    """
+    t_start = time.perf_counter()
+    tables = compile_map(make_map(cfg["size"], cfg["map_seed"]))
+    t_compile = time.perf_counter() - t_start
+
+    Q, model, stats = train_dyna_q(
+        tables, cfg["episodes"], cfg["alpha"], cfg["gamma"], cfg["planning_steps"],
+        cfg["planner"], PS_THETA, EPS_START, EPS_END, step_penalty=STEP_PENALTY,
+        fail_reward=-1.0, rng=np.random.default_rng(seed), check_every=CHECK_EVERY)
+    last = stats["goals"][-CHECK_EVERY:]
+    return {
+        "success_rate":         float(greedy_success(Q, *tables)),
+        "train_success_rate":   sum(last) / len(last),
+        "episodes_to_converge": stats["episodes_to_converge"],
+        "transitions":          stats["transitions"],
+        "planning_updates":     model.updates,
+        "timing": {
+            "total_s":   time.perf_counter() - t_start,
+            "compile_s": t_compile,
+            **stats["timing"],
+        },
+    }
+
+def _run_job(cfg, seed):
+    return cfg, seed, os.getpid(), run_config(cfg, seed)
+
+# ── SWEEP DRIVER (host side) ─────────────────────────────────────────────────
+def load_results(path):
+    """Finished runs in the results file; a torn last line from an interrupt is ignored."""
+    rows = []
+    if not os.path.exists(path):
+        return rows
+    with open(path) as f:
+        for line in f:
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return rows
+
+def run_sweep(configs, results=RESULTS, workers=None, base_seed=0):
+    """
+    Run every config not yet in `results` on a process pool, appending one
+    JSON line per finished run as it completes.  Returns (ran, skipped).
+    """
+    workers = workers or os.cpu_count() or 1
+    done = {config_key(r["config"]) for r in load_results(results)}
+    todo = [cfg for cfg in configs if config_key(cfg) not in done]
+    skipped = len(configs) - len(todo)
+    print(f"{len(configs)} configs, {skipped} already in {results}, "
+          f"{len(todo)} to run on {workers} worker(s)")
+
+    start = time.perf_counter()
+    ran = 0
+    with open(results, "a+") as out, ProcessPoolExecutor(max_workers=workers) as pool:
+        if out.tell():  # close off a line torn by an earlier interrupt
+            out.seek(out.tell() - 1)
+            if out.read(1) != "\n":
+                out.write("\n")
+        futures = [pool.submit(_run_job, cfg, run_seed(cfg, base_seed)) for cfg in todo]
+        try:
+            for fut in as_completed(futures):
+                cfg, seed, pid, result = fut.result()
+                out.write(json.dumps({"config": cfg, "seed": seed, "pid": pid, **result}) + "\n")
+                out.flush()
+                ran += 1
+                print(f"  [{ran}/{len(todo)}] {config_key(cfg)} -> success {result['success_rate']:.0%}, "
+                      f"converged @ {result['episodes_to_converge']}, {result['timing']['total_s']:.1f} s")
+        except KeyboardInterrupt:
+            for fut in futures:
+                fut.cancel()
+            print(f"\nInterrupted after {ran} run(s); rerun the same command to resume.")
+            raise
+    print(f"Finished {ran} run(s) in {time.perf_counter() - start:.1f} s")
+    return ran, skipped
+
+def print_best(results, top=10):
+    """Best configs: solved first, then fewest episodes to converge, then wall time."""
+    rows = load_results(results)
+    rows.sort(key=lambda r: (-r["success_rate"], r["episodes_to_converge"] or float("inf"),
+                             r["timing"]["total_s"]))
+    print(f"\n=== Top {min(top, len(rows))} of {len(rows)} runs ===")
+    for r in rows[:top]:
+        t = r["timing"]
+        print(f"  {config_key(r['config'])}\n"
+              f"    success {r['success_rate']:.0%}  converged @ {r['episodes_to_converge']}  "
+              f"total {t['total_s']:.2f}s (select {t['select_s']:.2f}, step {t['step_s']:.2f}, "
+              f"update {t['update_s']:.2f}, planning {t['planning_s']:.2f})")
+
+# ── MAIN ENTRY POINT ──────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel, resumable FrozenLake hyper-parameter sweep")
+    parser.add_argument("--mode", choices=["grid", "random"], default="grid")
+    parser.add_argument("--samples", type=int, default=SAMPLES, help="random-search draws")
+    parser.add_argument("--seed", type=int, default=0, help="random-search and per-run base seed")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--results", default=RESULTS, help="JSONL results file (appended, resumable)")
+    for name in GRID:  # optional overrides of the grid axes
+        kind = str if name == "planner" else (float if name in ("alpha", "gamma") else int)
+        parser.add_argument("--" + name.replace("_", "-"), type=kind, nargs="+")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.mode == "grid":
+        grid = {k: getattr(args, k) or v for k, v in GRID.items()}
+        configs = grid_configs(grid)
+    else:
+        space = {k: getattr(args, k) or v for k, v in RANDOM_SPACE.items()}
+        configs = random_configs(args.samples, args.seed, space)
+
+    run_sweep(configs, args.results, args.workers, args.seed)
+    print_best(args.results, args.top)
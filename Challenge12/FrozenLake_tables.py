@@ -0,0 +1,87 @@
+import numpy as np
+import gym
+
+# ── PATCH NUMPY FOR GYM COMPATIBILITY ────────────────────────────────────────
+if not hasattr(np, 'bool8'):
+    setattr(np, 'bool8', np.bool_)
+
+# ── DETERMINISTIC FROZENLAKE AS DENSE TABLES ─────────────────────────────────
+# With is_slippery=False every (state, action) has exactly one outcome, so a
+# generate_random_map layout compiles to three arrays and env.step becomes
+# two lookups.  gym.make("FrozenLake-v1") also wraps the env in a 100-step
+# TimeLimit; table-driven loops must truncate at MAX_STEPS themselves.
+MAX_STEPS = 100
+MOVES     = [(0, -1), (1, 0), (0, 1), (-1, 0)]   # LEFT, DOWN, RIGHT, UP
+
+def compile_map(desc):
+    """
+    Returns next_state[nS, nA], reward[nS, nA], terminal[nS] and the start
+    state.  Moves are clamped at the border; G and H are absorbing (every
+    action loops back with reward 0), as in gym's transition model.
+    """
+    grid = np.asarray([list(row) for row in desc])
+    nrow, ncol = grid.shape
+    cells = grid.ravel()
+    terminal = np.isin(cells, ["G", "H"])
+
+    rows, cols = np.divmod(np.arange(nrow * ncol), ncol)
+    next_state = np.empty((nrow * ncol, len(MOVES)), dtype=np.int64)
+    for a, (dr, dc) in enumerate(MOVES):
+        r2 = np.clip(rows + dr, 0, nrow - 1)
+        c2 = np.clip(cols + dc, 0, ncol - 1)
+        next_state[:, a] = r2 * ncol + c2
+    next_state[terminal] = np.flatnonzero(terminal)[:, None]
+
+    reward = (cells[next_state] == "G").astype(float)
+    reward[terminal] = 0.0
+    start = int(np.flatnonzero(cells == "S")[0])
+    return next_state, reward, terminal, start
+
+def validate_against_gym(desc, tables=None):
+    """
+    Step gym's FrozenLake from every (state, action) and compare against the
+    compiled tables; raises ValueError on the first mismatch.  Handles both
+    the old (4-tuple step) and new (5-tuple step, (obs, info) reset) gym APIs.
+    """
+    next_state, reward, terminal, start = tables or compile_map(desc)
+    env = gym.make("FrozenLake-v1", desc=desc, is_slippery=False)
+    nS, nA = env.observation_space.n, env.action_space.n
+    if next_state.shape != (nS, nA):
+        raise ValueError(f"table shape {next_state.shape} != gym ({nS}, {nA})")
+
+    s0 = env.reset()
+    s0 = s0[0] if isinstance(s0, tuple) else s0
+    if s0 != start:
+        raise ValueError(f"start state {start} != gym {s0}")
+
+    checked = 0
+    for s in range(nS):
+        for a in range(nA):
+            env.reset()
+            env.unwrapped.s = s
+            out = env.step(a)
+            if len(out) == 5:
+                s2, r, term, _, _ = out
+            else:
+                s2, r, term, _ = out
+            got = (int(s2), float(r), bool(term))
+            expected = (int(next_state[s, a]), float(reward[s, a]), bool(terminal[next_state[s, a]]))
+            if got != expected:
+                raise ValueError(f"(s={s}, a={a}): gym {got} != table {expected}")
+            checked += 1
+    env.close()
+    return checked
+
+# ── SELF-CHECK ───────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    import time
+    from gym.envs.toy_text.frozen_lake import generate_random_map
+
+    for size in (4, 8, 15, 30):
+        desc = generate_random_map(size=size, p=0.8)
+        t0 = time.perf_counter()
+        tables = compile_map(desc)
+        t_compile = time.perf_counter() - t0
+        checked = validate_against_gym(desc, tables)
+        print(f"{size:>3}×{size:<3} compiled in {t_compile * 1e3:7.3f} ms, "
+              f"{checked} transitions match gym")
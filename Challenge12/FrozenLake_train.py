@@ -0,0 +1,131 @@
+import time
+
+import numpy as np
+
+from FrozenLake_model import DynaModel, PrioritizedModel
+from FrozenLake_tables import MAX_STEPS
+
+# ── SHARED DYNA-Q TRAINING LOOP ──────────────────────────────────────────────
+# FrozenLake.py, FrozenLake_new.py and FrozenLake_sweep.py all train through
+# train_dyna_q; what used to differ between their copies of the loop (alpha
+# schedule, failure penalty, table or gym stepping, convergence checks) is
+# passed in as arguments.
+def make_model(planner, nS, nA, ps_theta=1e-3, rng=None):
+    """"prioritized" sweeping, or uniform Dyna-Q replay for anything else."""
+    if planner == "prioritized":
+        return PrioritizedModel(nS, nA, ps_theta, rng=rng)
+    return DynaModel(nS, nA, rng=rng)
+
+def greedy_success(Q, next_table, reward_table, terminal_table, start):
+    """The maps are deterministic, so one greedy rollout is the evaluation."""
+    state = start
+    for _ in range(MAX_STEPS):
+        action = int(np.argmax(Q[state]))
+        reward = reward_table[state][action]
+        state = next_table[state][action]
+        if terminal_table[state]:
+            return reward > 0
+    return False
+
+def train_dyna_q(tables, episodes, alpha, gamma, planning_steps, planner="uniform",
+                 ps_theta=1e-3, eps_start=1.0, eps_end=0.01, alpha_end=None,
+                 step_penalty=0.0, fail_reward=None, env=None, rng=None,
+                 check_every=0, progress_every=0):
+    """
+    Epsilon-greedy Dyna-Q on a map compiled by compile_map, stepping through
+    the tables, or through a gym `env` if one is given (tables may then be
+    None unless check_every is used).  Epsilon, and alpha when alpha_end is set, decay linearly per
+    episode.  An episode that ends without the goal is rewarded fail_reward
+    instead of 0 (if set), and every step pays step_penalty.  Every
+    check_every episodes the greedy policy is rolled out on the tables;
+    episodes_to_converge is the first check after which every later one
+    reached the goal (None if never).  Returns (Q, model, stats).
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    if tables is not None:
+        next_table, reward_table, terminal_table = (t.tolist() for t in tables[:3])
+        start = tables[3]
+        nS, nA = tables[0].shape
+    else:
+        nS, nA = env.observation_space.n, env.action_space.n
+    model = make_model(planner, nS, nA, ps_theta, rng=rng)
+    Q = np.zeros((nS, nA))
+    eps_decay = (eps_start - eps_end) / episodes
+    alpha_start = alpha
+    alpha_decay = 0.0 if alpha_end is None else (alpha_start - alpha_end) / episodes
+
+    time_select = time_step = time_update = time_plan = time_check = 0.0
+    transitions = 0
+    goals = []
+    converged = None
+    for ep in range(episodes):
+        eps = max(eps_end, eps_start - eps_decay * ep)
+        if alpha_end is not None:
+            alpha = max(alpha_end, alpha_start - alpha_decay * ep)
+        if env is None:
+            state = start
+        else:
+            state = env.reset()
+            state = state[0] if isinstance(state, tuple) else state
+        steps, done = 0, False
+        while not done:
+            t0 = time.perf_counter()
+            if rng.random() < eps:
+                action = int(rng.integers(nA))
+            else:
+                action = int(np.argmax(Q[state]))
+            t1 = time.perf_counter()
+            steps += 1
+            if env is None:
+                nxt    = next_table[state][action]
+                reward = reward_table[state][action]
+                done   = terminal_table[nxt] or steps >= MAX_STEPS
+            else:
+                out = env.step(action)
+                if len(out) == 5:
+                    nxt, reward, term, trunc, _ = out
+                    done = term or trunc
+                else:
+                    nxt, reward, done, _ = out
+            goal = reward > 0
+            if done and reward == 0 and fail_reward is not None:
+                reward = fail_reward
+            reward -= step_penalty
+            t2 = time.perf_counter()
+            Q[state, action] += alpha * (reward + gamma * Q[nxt].max() - Q[state, action])
+            t3 = time.perf_counter()
+            if planning_steps:
+                model.add(state, action, nxt, reward)
+                model.plan(Q, alpha, gamma, planning_steps)
+            t4 = time.perf_counter()
+            time_select += t1 - t0
+            time_step   += t2 - t1
+            time_update += t3 - t2
+            time_plan   += t4 - t3
+            state = nxt
+        transitions += steps
+        goals.append(goal)
+
+        if check_every and ((ep + 1) % check_every == 0 or ep + 1 == episodes):
+            t0 = time.perf_counter()
+            if greedy_success(Q, next_table, reward_table, terminal_table, start):
+                converged = converged or ep + 1
+            else:
+                converged = None
+            time_check += time.perf_counter() - t0
+        if progress_every and (ep + 1) % progress_every == 0:
+            print(f"  Trained {ep + 1}/{episodes} episodes")
+
+    stats = {
+        "transitions":          transitions,
+        "goals":                goals,       # per episode: did it end on the goal?
+        "episodes_to_converge": converged,
+        "timing": {
+            "select_s":   time_select,
+            "step_s":     time_step,
+            "update_s":   time_update,
+            "planning_s": time_plan,
+            "check_s":    time_check,
+        },
+    }
+    return Q, model, stats
@@ -0,0 +1,141 @@
+import time
+import numpy as np
+from gym.envs.toy_text.frozen_lake import generate_random_map
+
+from FrozenLake_tables import MAX_STEPS, compile_map
+
+# ── CONFIGURATION ───────────────────────────────────────────────────────────
+# Same knobs and reward shaping as FrozenLake_new.py; every env is an
+# independent agent (own Q-table), so ALPHA/GAMMA/EPS_* may also be given
+# per env as arrays when sweeping.
+SIZE            = 15               # 15×15 grid
+HOLE_PROB       = 0.2              # 20% holes
+FREEZE_P        = 1 - HOLE_PROB
+N_ENVS          = 1024             # FrozenLake instances stepped in lockstep
+EPISODES        = 5_000            # training episodes per env
+ALPHA           = 0.1              # learning rate
+GAMMA           = 0.99             # discount factor
+EPS_START       = 1.0              # initial exploration
+EPS_END         = 0.01             # final exploration
+STEP_PENALTY    = 0.001            # small penalty to encourage shortest paths
+HOLE_PENALTY    = -1.0             # reward for an episode ending without the goal
+CURVE_WINDOW    = 100              # episodes per learning-curve point
+SEED            = 0
+
+# ── BATCHED Q-LEARNING ───────────────────────────────────────────────────────
+def _per_env(value, n_envs):
+    return np.broadcast_to(np.asarray(value, dtype=float), (n_envs,)).copy()
+
+def train_vectorized(desc, n_envs=N_ENVS, episodes=EPISODES, alpha=ALPHA, gamma=GAMMA,
+                     eps_start=EPS_START, eps_end=EPS_END, seed=SEED):
+    """
+    Train n_envs independent Q-learning agents on the same map in lockstep.
+    Each env runs `episodes` episodes with FrozenLake_new.py's schedule
+    (linear epsilon decay per episode, -1 on a failed ending, step
+    penalty); finished envs idle until the slowest one is done.
+    Returns Q[n_envs, nS, nA], successes per CURVE_WINDOW episodes
+    [n_envs, episodes // CURVE_WINDOW] and timing counters.
+    """
+    rng = np.random.default_rng(seed)
+    next_state, goal_reward, terminal, start = compile_map(desc)
+    nS, nA = next_state.shape
+
+    alpha     = _per_env(alpha, n_envs)
+    gamma     = _per_env(gamma, n_envs)
+    eps_start = _per_env(eps_start, n_envs)
+    eps_end   = _per_env(eps_end, n_envs)
+    eps_decay = (eps_start - eps_end) / episodes
+
+    Q       = np.zeros((n_envs, nS, nA))
+    curve   = np.zeros((n_envs, max(1, episodes // CURVE_WINDOW)), dtype=np.int64)
+    env     = np.arange(n_envs)
+    state   = np.full(n_envs, start, dtype=np.int64)
+    steps   = np.zeros(n_envs, dtype=np.int64)
+    episode = np.zeros(n_envs, dtype=np.int64)
+
+    time_select = time_step = time_update = 0.0
+    transitions = 0
+    train_start = time.perf_counter()
+    live = env
+    while live.size:
+        s = state[live]
+
+        # epsilon-greedy action for every live env at once
+        t0 = time.perf_counter()
+        eps = np.maximum(eps_end[live], eps_start[live] - eps_decay[live] * episode[live])
+        greedy = Q[live, s].argmax(axis=1)
+        explore = rng.random(live.size) < eps
+        action = np.where(explore, rng.integers(0, nA, live.size), greedy)
+        time_select += time.perf_counter() - t0
+
+        # compiled table lookup instead of env.step
+        t0 = time.perf_counter()
+        s2 = next_state[s, action]
+        r = goal_reward[s, action]
+        steps[live] += 1
+        done = terminal[s2] | (steps[live] >= MAX_STEPS)
+        r = np.where(done & (r == 0), HOLE_PENALTY, r) - STEP_PENALTY
+        time_step += time.perf_counter() - t0
+
+        # scatter Q update: one (env, s, a) cell per live env, no collisions
+        t0 = time.perf_counter()
+        target = r + gamma[live] * Q[live, s2].max(axis=1)
+        Q[live, s, action] += alpha[live] * (target - Q[live, s, action])
+        time_update += time.perf_counter() - t0
+        transitions += live.size
+
+        # finished episodes: record, reset, and retire envs that are done
+        state[live] = s2
+        ended = live[done]
+        if ended.size:
+            success = goal_reward[s[done], action[done]] > 0
+            window = np.minimum(episode[ended] // CURVE_WINDOW, curve.shape[1] - 1)
+            np.add.at(curve, (ended, window), success)
+            episode[ended] += 1
+            state[ended] = start
+            steps[ended] = 0
+            live = live[episode[live] < episodes]
+
+    timing = {"train_s": time.perf_counter() - train_start, "select_s": time_select,
+              "step_s": time_step, "update_s": time_update, "transitions": transitions}
+    return Q, curve, timing
+
+def evaluate_vectorized(desc, Q):
+    """Greedy rollout of every env's Q (the map is deterministic): goal reached?"""
+    next_state, goal_reward, terminal, start = compile_map(desc)
+    n_envs = Q.shape[0]
+    env = np.arange(n_envs)
+    state = np.full(n_envs, start, dtype=np.int64)
+    success = np.zeros(n_envs, dtype=bool)
+    active = np.ones(n_envs, dtype=bool)
+    for _ in range(MAX_STEPS):
+        action = Q[env, state].argmax(axis=1)
+        s2 = next_state[state, action]
+        success |= active & (goal_reward[state, action] > 0)
+        active &= ~terminal[s2]
+        state = np.where(active, s2, state)
+        if not active.any():
+            break
+    return success
+
+# ── MAIN ENTRY POINT ──────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    np.random.seed(SEED)  # generate_random_map draws from the global RNG
+    RANDOM_MAP = generate_random_map(size=SIZE, p=FREEZE_P)
+
+    print(f"Training {N_ENVS} agents × {EPISODES} episodes in lockstep...")
+    Q, curve, timing = train_vectorized(RANDOM_MAP)
+    success = evaluate_vectorized(RANDOM_MAP, Q)
+
+    print(f"\nTraining time:           {timing['train_s']:.3f}s")
+    print(f"  - select action:       {timing['select_s']:.3f}s")
+    print(f"  - table steps:         {timing['step_s']:.3f}s")
+    print(f"  - Q updates:           {timing['update_s']:.3f}s")
+    print(f"Transitions:             {timing['transitions']:,} "
+          f"({timing['transitions'] / timing['train_s']:,.0f}/s)")
+    print(f"Agents reaching goal:    {success.sum()}/{N_ENVS} ({success.mean():.2%})")
+
+    print("\n=== Learning curve (mean success per window) ===")
+    rates = curve.mean(axis=0) / CURVE_WINDOW
+    for i in range(0, len(rates), max(1, len(rates) // 10)):
+        print(f"  episodes {i * CURVE_WINDOW:>7}-{(i + 1) * CURVE_WINDOW - 1:<7} {rates[i]:.2%}")
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import ecdsa_host
+
+log = logging.getLogger(__name__)
+
+# ——— Request coalescing ———
+class _Coalescer:
+    """
+    Collects concurrent requests into micro-batches. A batch is flushed
+    as soon as it holds max_batch requests, or max_wait seconds after its
+    first request arrived, and is run by batch_fn in the executor so the
+    event loop never blocks on big-integer math or the simulator.
+    """
+    def __init__(self, name, batch_fn, max_batch, max_wait, executor, log_batches):
+        self.name        = name
+        self.batch_fn    = batch_fn
+        self.max_batch   = max_batch
+        self.max_wait    = max_wait
+        self.executor    = executor
+        self.log_batches = log_batches
+        self._pending    = []    # (request, future)
+        self._timer      = None
+        self._inflight   = set()
+
+    def submit(self, request):
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._pending.append((request, fut))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self.flush)
+        return fut
+
+    def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        if self.log_batches:
+            log.info("%s: flushing batch of %d", self.name, len(batch))
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self.executor, self.batch_fn,
+                                    [request for request, _ in batch])
+        self._inflight.add(task)
+        task.add_done_callback(lambda t: self._deliver(batch, t))
+
+    def _deliver(self, batch, task):
+        self._inflight.discard(task)
+        if task.cancelled() or task.exception() is not None:
+            exc = asyncio.CancelledError() if task.cancelled() else task.exception()
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for (_, fut), result in zip(batch, task.result()):
+            if not fut.done():
+                fut.set_result(result)
+
+    async def drain(self):
+        self.flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+# ——— Async front end for ecdsa_host ———
+class AsyncECDSA:
+    """
+    await sign(msg, priv) / await verify(msg, sig, pub) on top of
+    ecdsa_host.sign_batch / verify_batch. Concurrent callers are coalesced
+    into batches of up to max_batch, waiting at most max_wait seconds.
+    """
+    def __init__(self, max_batch=64, max_wait=0.002, executor=None, log_batches=False):
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=1)
+        self._signer   = _Coalescer("sign", ecdsa_host.sign_batch, max_batch,
+                                    max_wait, self._executor, log_batches)
+        self._verifier = _Coalescer("verify", ecdsa_host.verify_batch, max_batch,
+                                    max_wait, self._executor, log_batches)
+
+    async def sign(self, msg: bytes, priv: int):
+        return await self._signer.submit((msg, priv))
+
+    async def verify(self, msg: bytes, sig: tuple, pub: tuple) -> bool:
+        return await self._verifier.submit((msg, sig, pub))
+
+    async def aclose(self):
+        await self._signer.drain()
+        await self._verifier.drain()
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+if __name__ == "__main__":
+    ecdsa_host.USE_HW = False
+    NUM_REQUESTS = 500
+
+    async def main():
+        priv, pub = ecdsa_host.gen_keypair()
+        msgs = [f"message {i}".encode() for i in range(NUM_REQUESTS)]
+        async with AsyncECDSA(max_batch=64, max_wait=0.002) as svc:
+            start = time.perf_counter()
+            sigs = await asyncio.gather(*(svc.sign(m, priv) for m in msgs))
+            t_sign = time.perf_counter() - start
+
+            start = time.perf_counter()
+            ok = await asyncio.gather(*(svc.verify(m, s, pub) for m, s in zip(msgs, sigs)))
+            t_verify = time.perf_counter() - start
+        print(f"All verified: {all(ok)}")
+        print(f"async sign:   {NUM_REQUESTS / t_sign:.1f}/s")
+        print(f"async verify: {NUM_REQUESTS / t_verify:.1f}/s")
+
+    asyncio.run(main())
@@ -1,11 +1,24 @@
+import atexit
 import hashlib
+import json
+import queue
+import random
 import secrets
 import os
+import socket
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                TimeoutError as FutureTimeout, wait)
 
 # Choose between HW and SW scalar multiplication here:
 USE_HW = True  # Toggle this to True to use RTL version
 
+# Per-call [INFO] prints in scalar_mult (off keeps the hot path quiet)
+VERBOSE = os.environ.get("ECDSA_HOST_VERBOSE") == "1"
+
 # ——— Domain parameters for secp256k1 ———
 p  = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
 a  = 0
@@ -18,24 +31,8 @@ G  = (Gx, Gy)
 n  = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
 
 # ——— Finite-field and EC point ops ———
-#def inv_mod(k, m):
-#    return pow(k, -1, m)
-
-
 def inv_mod(k, m):
-    """
-    Extended-Euclidean modular inverse (works on Python ≥3.0).
-    """
-    k = k % m
-    if k == 0:
-        raise ZeroDivisionError("division by zero")
-    lm, low = 1, k
-    hm, high = 0, m
-    while low > 1:
-        r = high // low
-        nm, new = hm - lm * r, high - low * r
-        lm, low, hm, high = nm, new, lm, low
-    return lm % m
+    return pow(k, -1, m)  # C-level; ~2x faster than the old extended-Euclid loop
 
 def is_on_curve(P):
     if P is None:
@@ -58,20 +55,297 @@ def point_add(P, Q):
     y3 = (lam*(x1 - x3) - y1) % p
     return (x3, y3)
 
+# ——— Jacobian-coordinate point ops ———
+# A Jacobian point (X, Y, Z) stands for the affine point (X/Z^2, Y/Z^3).
+# Adds and doubles need no inversion; only from_jacobian() pays for one.
+# The point at infinity is None, same as in the affine routines above.
+def to_jacobian(P):
+    if P is None:
+        return None
+    x, y = P
+    return (x, y, 1)
+
+def from_jacobian(J):
+    if J is None:
+        return None
+    X, Y, Z = J
+    z_inv  = inv_mod(Z, p)
+    z_inv2 = (z_inv * z_inv) % p
+    return ((X * z_inv2) % p, (Y * z_inv2 * z_inv) % p)
+
+def batch_from_jacobian(points):
+    """from_jacobian over a list, sharing one inversion via batch_inv_mod."""
+    live = [J for J in points if J is not None]
+    z_invs = iter(batch_inv_mod([J[2] for J in live], p))
+    out = []
+    for J in points:
+        if J is None:
+            out.append(None)
+            continue
+        X, Y, _ = J
+        z_inv  = next(z_invs)
+        z_inv2 = (z_inv * z_inv) % p
+        out.append(((X * z_inv2) % p, (Y * z_inv2 * z_inv) % p))
+    return out
+
+def jacobian_double(J):
+    if J is None:
+        return None
+    X, Y, Z = J
+    if Y == 0:
+        return None
+    YY = (Y * Y) % p
+    S  = (4 * X * YY) % p
+    M  = (3 * X * X) % p  # a = 0 on secp256k1, so no a*Z^4 term
+    X3 = (M * M - 2 * S) % p
+    Y3 = (M * (S - X3) - 8 * YY * YY) % p
+    Z3 = (2 * Y * Z) % p
+    return (X3, Y3, Z3)
+
+def jacobian_add(J1, J2):
+    if J1 is None: return J2
+    if J2 is None: return J1
+    X1, Y1, Z1 = J1
+    X2, Y2, Z2 = J2
+    Z1Z1 = (Z1 * Z1) % p
+    Z2Z2 = (Z2 * Z2) % p
+    U1 = (X1 * Z2Z2) % p
+    U2 = (X2 * Z1Z1) % p
+    S1 = (Y1 * Z2 * Z2Z2) % p
+    S2 = (Y2 * Z1 * Z1Z1) % p
+    H  = (U2 - U1) % p
+    R  = (S2 - S1) % p
+    if H == 0:
+        if R == 0:
+            return jacobian_double(J1)
+        return None
+    HH  = (H * H) % p
+    HHH = (H * HH) % p
+    V   = (U1 * HH) % p
+    X3 = (R * R - HHH - 2 * V) % p
+    Y3 = (R * (V - X3) - S1 * HHH) % p
+    Z3 = (H * Z1 * Z2) % p
+    return (X3, Y3, Z3)
+
+def jacobian_add_mixed(J, Q):
+    """
+    Mixed addition J + Q where Q is affine (implicit Z = 1), which saves
+    the Z2 products of the general jacobian_add.
+    """
+    if Q is None: return J
+    if J is None: return to_jacobian(Q)
+    X1, Y1, Z1 = J
+    x2, y2 = Q
+    Z1Z1 = (Z1 * Z1) % p
+    U2 = (x2 * Z1Z1) % p
+    S2 = (y2 * Z1 * Z1Z1) % p
+    H  = (U2 - X1) % p
+    R  = (S2 - Y1) % p
+    if H == 0:
+        if R == 0:
+            return jacobian_double(J)
+        return None
+    HH  = (H * H) % p
+    HHH = (H * HH) % p
+    V   = (X1 * HH) % p
+    X3 = (R * R - HHH - 2 * V) % p
+    Y3 = (R * (V - X3) - Y1 * HHH) % p
+    Z3 = (H * Z1) % p
+    return (X3, Y3, Z3)
+
 # Hardware-based scalar multiplication via Cocotb/Questa
+HW_SIM        = os.environ.get("ECDSA_HW_SIM", "questa")  # or "icarus", "verilator", "model"
+HW_PERSISTENT = True  # False relaunches make for every hw_scalar_mult
+TB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tb"))
+
+# ——— Persistent co-simulation session ———
+# One simulator launch serves any number of k*P jobs: the run_hw_server
+# test in tb/test_hw_sign.py connects back to a local socket, keeps the
+# DUT out of reset and streams one JSON result line per JSON job line.
+class HWSimSession:
+    def __init__(self, sim=HW_SIM, tb_dir=TB_DIR, connect_timeout=600,
+                 max_inflight=256, log_path=None):
+        self.sim             = sim
+        self.tb_dir          = tb_dir
+        self.connect_timeout = connect_timeout
+        self.max_inflight    = max_inflight
+        self.log_path        = log_path
+        self._proc           = None
+        self._next_id        = 0
+        self.last_perf       = None  # PerfMonitor counters of the latest job
+
+    def start(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        server.settimeout(0.5)  # short accepts so a dead make is noticed at once
+
+        env = os.environ.copy()
+        env["HW_SERVER_ADDR"]     = "127.0.0.1:%d" % server.getsockname()[1]
+        env["TESTCASE"]           = "run_hw_server"  # cocotb 1.x
+        env["COCOTB_TEST_FILTER"] = "run_hw_server"  # cocotb 2.x
+        # without a log_path the make output still goes to a temp file, so a
+        # failed launch can report it (a pipe could fill up and stall the sim)
+        self._log = open(self.log_path, "w+") if self.log_path else tempfile.TemporaryFile("w+")
+        self._proc = subprocess.Popen(
+            ["make", "-C", self.tb_dir, f"SIM={self.sim}"],
+            env=env, stdout=self._log, stderr=subprocess.STDOUT,
+        )
+        deadline = time.monotonic() + self.connect_timeout
+        try:
+            while True:
+                try:
+                    conn, _ = server.accept()
+                    break
+                except socket.timeout:
+                    pass
+                code = self._proc.poll()
+                if code is not None:
+                    self._abort()
+                    raise RuntimeError(f"Simulator exited with code {code} before connecting "
+                                       f"to the co-simulation session:\n{self._output}")
+                if time.monotonic() > deadline:
+                    self._proc.kill()
+                    self._abort()
+                    raise RuntimeError(f"Simulator did not connect to the co-simulation session "
+                                       f"within {self.connect_timeout} s:\n{self._output}")
+        finally:
+            server.close()
+        conn.settimeout(None)
+        self._conn  = conn
+        self._rfile = conn.makefile("r")
+        self._wfile = conn.makefile("w")
+        return self
+
+    def _abort(self, tail=40):
+        """Reap a failed launch and keep the last `tail` lines of make output."""
+        self._proc.wait()
+        self._log.flush()
+        self._log.seek(0)
+        self._output = "".join(self._log.readlines()[-tail:])
+        self._log.close()
+        self._proc = None
+
+    def submit(self, k: int, Px: int, Py: int) -> int:
+        job_id = self._next_id
+        self._next_id += 1
+        self._wfile.write(json.dumps({"id": job_id, "k": k, "px": Px, "py": Py}) + "\n")
+        self._wfile.flush()
+        return job_id
+
+    def next_result(self):
+        """(job_id, (X, Y) or None for infinity) of the next finished job."""
+        line = self._rfile.readline()
+        if not line:
+            raise RuntimeError("Simulator closed the co-simulation session")
+        res = json.loads(line)
+        self.last_perf = res.get("perf")
+        return res["id"], None if res["inf"] else (res["x"], res["y"])
+
+    def map(self, jobs):
+        """Stream (k, Px, Py) jobs through the simulator, at most max_inflight queued."""
+        jobs = list(jobs)
+        ids, results = [], {}
+        for job in jobs:
+            if len(ids) - len(results) >= self.max_inflight:
+                job_id, R = self.next_result()
+                results[job_id] = R
+            ids.append(self.submit(*job))
+        while len(results) < len(ids):
+            job_id, R = self.next_result()
+            results[job_id] = R
+        return [results[i] for i in ids]
+
+    def scalar_mult(self, k: int, Px: int, Py: int):
+        return self.map([(k, Px, Py)])[0]
+
+    def close(self):
+        if self._proc is None:
+            return
+        try:
+            self._wfile.write(json.dumps({"quit": True}) + "\n")
+            self._wfile.flush()
+        except OSError:
+            pass
+        self._conn.close()
+        self._proc.wait()
+        self._log.close()
+        self._proc = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+def hw_scalar_mult_batch(jobs, workdir=None):
+    """
+    Run a list of (k, Px, Py) jobs in one simulator launch via the
+    run_hw_batch test; returns the parsed results document (per-job
+    x, y, inf and PerfMonitor counters, plus totals). HW_SIM = "model"
+    answers from the Python cycle model in hw_model.py instead.
+    """
+    if HW_SIM == "model":
+        import hw_model
+        return hw_model.hw_scalar_mult_batch(jobs)
+    workdir = os.path.abspath(workdir or os.path.join(TB_DIR, "sim_build"))
+    os.makedirs(workdir, exist_ok=True)
+    jobs_path    = os.path.join(workdir, "hw_jobs.jsonl")
+    results_path = os.path.join(workdir, "hw_results.json")
+    with open(jobs_path, "w") as f:
+        for job_id, (k, Px, Py) in enumerate(jobs):
+            f.write(json.dumps({"id": job_id, "k": k, "px": Px, "py": Py}) + "\n")
+
+    env = os.environ.copy()
+    env["HW_JOBS_FILE"]        = jobs_path
+    env["HW_RESULTS_FILE"]     = results_path
+    env["COCOTB_RESULTS_FILE"] = os.path.join(workdir, "results.xml")
+    env["TESTCASE"]            = "run_hw_batch"  # cocotb 1.x
+    env["COCOTB_TEST_FILTER"]  = "run_hw_batch"  # cocotb 2.x
+    result = subprocess.run(
+        ["make", "-C", TB_DIR, f"SIM={HW_SIM}", f"SIM_BUILD={workdir}"],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        raise RuntimeError("Simulation failed")
+    with open(results_path) as f:
+        return json.load(f)
+
+_hw_session     = None
+_hw_start_error = None  # why the session failed to start; later calls fail at once
 
 def hw_scalar_mult(k: int, Px: int, Py: int) -> tuple:
+    if HW_SIM == "model":
+        import hw_model
+        return hw_model.hw_scalar_mult(k, Px, Py)
+
+    if HW_PERSISTENT:
+        global _hw_session, _hw_start_error
+        if _hw_start_error is not None:
+            raise RuntimeError("HW co-simulation session failed to start") from _hw_start_error
+        if _hw_session is None:
+            try:
+                _hw_session = HWSimSession().start()
+            except Exception as exc:
+                _hw_start_error = exc
+                raise
+            atexit.register(_hw_session.close)
+        R = _hw_session.scalar_mult(k, Px, Py)
+        if R is None:
+            raise ValueError("Output point is at infinity")
+        return R
+
     env = os.environ.copy()
     env["K_SCALAR"] = str(k)
     env["PX"] = str(Px)
     env["PY"] = str(Py)
 
-    # Get the absolute path to the tb/ directory
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    tb_dir = os.path.abspath(os.path.join(base_dir, "..", "tb"))
-
     result = subprocess.run(
-        ["make", "-C", "tb", "SIM=questa"],
+        ["make", "-C", TB_DIR, f"SIM={HW_SIM}"],
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
@@ -107,12 +381,88 @@ def sw_scalar_mult(k, P):
         k >>= 1
     return result
 
+# Jacobian scalar multiplication: left-to-right double-and-add with mixed
+# additions of the affine base point, one inversion for the whole ladder.
+def jacobian_scalar_mult(k, P):
+    if P is None:
+        return None
+    R = None
+    for bit in bin(k)[2:]:
+        R = jacobian_double(R)
+        if bit == "1":
+            R = jacobian_add_mixed(R, P)
+    return from_jacobian(R)
+
+# ——— wNAF scalar multiplication ———
+# Width-w non-adjacent form: signed odd digits |d| < 2^(w-1), at most one
+# non-zero digit in any w consecutive positions, so about 256/(w+1)
+# additions per scalar instead of 128. Negative digits add -T[|d|], and
+# negating an affine point only flips y.
+WNAF_WINDOW = 4
+
+def point_neg(P):
+    if P is None:
+        return None
+    x, y = P
+    return (x, (-y) % p)
+
+def odd_multiples(P, w):
+    """Affine [P, 3P, 5P, ..., (2^w - 1)P]."""
+    table = [to_jacobian(P)]
+    twoP = jacobian_double(table[0])
+    for _ in range((1 << (w - 1)) - 1):
+        table.append(jacobian_add(table[-1], twoP))
+    return batch_from_jacobian(table)
+
+def wnaf_digits(k, w):
+    """LSB-first wNAF digits of k >= 0."""
+    digits = []
+    full = 1 << w
+    half = 1 << (w - 1)
+    while k:
+        if k & 1:
+            d = k & (full - 1)
+            if d >= half:
+                d -= full
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+def wnaf_scalar_mult(k, P, w=None):
+    if P is None:
+        return None
+    w = WNAF_WINDOW if w is None else w
+    table = odd_multiples(P, w - 1)
+    neg   = [point_neg(T) for T in table]
+    R = None
+    for d in reversed(wnaf_digits(k, w)):
+        R = jacobian_double(R)
+        if d > 0:
+            R = jacobian_add_mixed(R, table[d >> 1])
+        elif d < 0:
+            R = jacobian_add_mixed(R, neg[(-d) >> 1])
+    return from_jacobian(R)
+
+# Software strategy used as the SW path (and as the reference for HW)
+SW_STRATEGIES = {
+    "affine":   sw_scalar_mult,
+    "jacobian": jacobian_scalar_mult,
+    "wnaf":     wnaf_scalar_mult,
+}
+SW_STRATEGY = "wnaf"  # "affine" selects the original double-and-add
+
 def scalar_mult(k, P):
-    print(f"[INFO] Entered scalar_mult with scalar k = {hex(k)}")
-    print(f"[INFO] Base Point P = ({hex(P[0])}, {hex(P[1])})")
-    if USE_HW:
+    if VERBOSE:
+        print(f"[INFO] Entered scalar_mult with scalar k = {hex(k)}")
+        print(f"[INFO] Base Point P = ({hex(P[0])}, {hex(P[1])})")
+    if USE_HW and HW_OFFLOAD:
+        return get_offload_scheduler().scalar_mult(k, P)
+    elif USE_HW:
         x1, y1 = hw_scalar_mult(k, P[0], P[1])
-        sw_x, sw_y = sw_scalar_mult(k, P)
+        sw_x, sw_y = SW_STRATEGIES[SW_STRATEGY](k, P)
         if (x1, y1) != (sw_x, sw_y):
             print("[MISMATCH] HW != SW")
             print(f"HW: ({hex(x1)}, {hex(y1)})")
@@ -120,7 +470,126 @@ def scalar_mult(k, P):
             raise ValueError("HW scalar_mult output does not match SW reference")
         return x1, y1
     else:
-        return sw_scalar_mult(k, P)
+        return SW_STRATEGIES[SW_STRATEGY](k, P)
+
+# ——— Asynchronous HW offload with SW fallback ———
+# One worker thread owns the hardware (simulator session) and serves a
+# queue of k*P jobs, so callers can submit() and keep working. result()
+# then applies HW_MODE:
+#   "fallback": wait up to HW_DEADLINE seconds for HW, else compute in SW
+#   "race":     run SW alongside HW and take whichever finishes first
+#   "hw":       always wait for HW
+# Race mode runs the SW side in a separate process so it never holds the
+# GIL against the caller. A SW job that has already started cannot be
+# cancelled when HW wins: it runs to completion in that process, and the
+# next race's SW side can queue behind it (by at most one SW multiply).
+# Only a HW_CHECK_RATE fraction of HW results is re-computed in SW and
+# compared; a mismatch still raises ValueError.
+HW_OFFLOAD    = True
+HW_MODE       = "fallback"
+HW_DEADLINE   = None  # seconds; None waits for HW indefinitely
+HW_CHECK_RATE = 0.1
+
+def _sw_strategy_mult(strategy, k, P):
+    """Race-mode SW side; module level so the SW process can unpickle it."""
+    return SW_STRATEGIES[strategy](k, P)
+
+class HWOffloadScheduler:
+    def __init__(self, backend=None, mode=None, deadline=None, check_rate=None):
+        self.backend    = backend or hw_scalar_mult
+        self.mode       = mode or HW_MODE
+        self.deadline   = HW_DEADLINE if deadline is None else deadline
+        self.check_rate = HW_CHECK_RATE if check_rate is None else check_rate
+        self.stats = {"hw": 0, "sw_fallback": 0, "sw_race_wins": 0,
+                      "hw_errors": 0, "checked": 0, "mismatches": 0}
+        self._jobs   = queue.Queue()
+        self._sw     = None  # race-mode SW process, started on first use
+        self._worker = threading.Thread(target=self._serve, daemon=True)
+        self._worker.start()
+
+    def _serve(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            k, P, fut = job
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(self.backend(k, P[0], P[1]))
+            except BaseException as exc:
+                fut.set_exception(exc)
+
+    def submit(self, k, P) -> Future:
+        """Queue k*P on the hardware; the Future resolves to (X, Y)."""
+        fut = Future()
+        self._jobs.put((k, P, fut))
+        return fut
+
+    def _sw_mult(self, k, P):
+        return SW_STRATEGIES[SW_STRATEGY](k, P)
+
+    def result(self, k, P, hw_fut):
+        if self.mode == "race":
+            if self._sw is None:
+                self._sw = ProcessPoolExecutor(max_workers=1)
+            sw_fut = self._sw.submit(_sw_strategy_mult, SW_STRATEGY, k, P)
+            done, _ = wait([hw_fut, sw_fut], timeout=self.deadline,
+                           return_when=FIRST_COMPLETED)
+            if hw_fut in done and hw_fut.exception() is None:
+                sw_fut.cancel()  # only drops it if the SW process has not started it
+                return self._checked(k, P, hw_fut.result())
+            if hw_fut.done() and hw_fut.exception() is not None:
+                self.stats["hw_errors"] += 1
+            hw_fut.cancel()
+            self.stats["sw_race_wins"] += 1
+            return sw_fut.result()
+
+        timeout = self.deadline if self.mode == "fallback" else None
+        try:
+            R = hw_fut.result(timeout=timeout)
+        except FutureTimeout:
+            hw_fut.cancel()  # drops it if the worker has not started it yet
+            self.stats["sw_fallback"] += 1
+            return self._sw_mult(k, P)
+        except Exception:
+            if self.mode != "fallback":
+                raise
+            self.stats["hw_errors"] += 1
+            self.stats["sw_fallback"] += 1
+            return self._sw_mult(k, P)
+        return self._checked(k, P, R)
+
+    def _checked(self, k, P, R):
+        self.stats["hw"] += 1
+        if self.check_rate and random.random() < self.check_rate:
+            self.stats["checked"] += 1
+            sw_R = self._sw_mult(k, P)
+            if R != sw_R:
+                self.stats["mismatches"] += 1
+                print("[MISMATCH] HW != SW")
+                print(f"HW: ({hex(R[0])}, {hex(R[1])})")
+                print(f"SW: ({hex(sw_R[0])}, {hex(sw_R[1])})")
+                raise ValueError("HW scalar_mult output does not match SW reference")
+        return R
+
+    def scalar_mult(self, k, P):
+        return self.result(k, P, self.submit(k, P))
+
+    def close(self):
+        self._jobs.put(None)
+        self._worker.join()
+        if self._sw is not None:
+            self._sw.shutdown(wait=False, cancel_futures=True)
+
+_offload = None
+
+def get_offload_scheduler():
+    global _offload
+    if _offload is None:
+        _offload = HWOffloadScheduler()
+        atexit.register(_offload.close)
+    return _offload
 
 def gen_keypair():
     priv = secrets.randbelow(n-1) + 1
@@ -152,17 +621,67 @@ def verify(msg: bytes, sig: tuple, pub: tuple) -> bool:
     w = inv_mod(s, n)
     u1 = (e * w) % n
     u2 = (r * w) % n
-    X = point_add(scalar_mult(u1, G), scalar_mult(u2, pub))
+    if USE_HW and HW_OFFLOAD:
+        # Queue both products before waiting, so SW fallbacks/races on the
+        # first overlap with the hardware working on the second
+        sched = get_offload_scheduler()
+        f1, f2 = sched.submit(u1, G), sched.submit(u2, pub)
+        X = point_add(sched.result(u1, G, f1), sched.result(u2, pub, f2))
+    else:
+        X = point_add(scalar_mult(u1, G), scalar_mult(u2, pub))
     if X is None:
         return False
     x1, _ = X
     return (x1 % n) == r
 
+# ——— Batched sign/verify: one modular inversion mod n per batch ———
+def batch_inv_mod(values, m):
+    """Montgomery's trick: all inverses for one inv_mod plus 3 mults each."""
+    prefix = []
+    acc = 1
+    for v in values:
+        acc = (acc * v) % m
+        prefix.append(acc)
+    inv = inv_mod(acc, m)
+    out = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        out[i] = (inv * prefix[i - 1]) % m
+        inv = (inv * values[i]) % m
+    if values:
+        out[0] = inv
+    return out
+
+def sign_batch(jobs):
+    """Sign a list of (msg, priv); every k^-1 comes from one batch inversion."""
+    ks = [secrets.randbelow(n-1) + 1 for _ in jobs]
+    rs = [scalar_mult(k, G)[0] % n for k in ks]
+    k_invs = batch_inv_mod(ks, n)
+    sigs = []
+    for (msg, priv), r, k_inv in zip(jobs, rs, k_invs):
+        s = (k_inv * (sha256_int(msg) + priv * r)) % n
+        # r == 0 or s == 0 is astronomically rare; redo that one alone
+        sigs.append((r, s) if r and s else sign(msg, priv))
+    return sigs
+
+def verify_batch(items):
+    """One bool per (msg, sig, pub); every s^-1 comes from one batch inversion."""
+    items = list(items)
+    results = [False] * len(items)
+    live = [(i, msg, sig, pub) for i, (msg, sig, pub) in enumerate(items)
+            if 1 <= sig[0] < n and 1 <= sig[1] < n]
+    ws = batch_inv_mod([sig[1] for _, _, sig, _ in live], n)
+    for (i, msg, (r, s), pub), w in zip(live, ws):
+        u1 = (sha256_int(msg) * w) % n
+        u2 = (r * w) % n
+        X = point_add(scalar_mult(u1, G), scalar_mult(u2, pub))
+        results[i] = X is not None and (X[0] % n) == r
+    return results
+
 if __name__ == "__main__":
     priv, pub = gen_keypair()
-    msg = b"A" * (4096 * 4096)  # 4MB
+    msg = b"A" * (4096 * 4096)  # 16 MiB
 
     sig = sign(msg, priv)
     ok  = verify(msg, sig, pub)
-    print("Verified on 4MB message:", ok)
+    print("Verified on 16 MiB message:", ok)
 
@@ -0,0 +1,127 @@
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import ecdsa_host
+
+# ——— Regression vectors ———
+def edge_vectors():
+    """Scalars around 0, 1, n and powers of two against G, -G and 2G."""
+    n = ecdsa_host.n
+    points = [ecdsa_host.G, ecdsa_host.point_neg(ecdsa_host.G),
+              ecdsa_host.sw_scalar_mult(2, ecdsa_host.G)]
+    scalars = [0, 1, 2, 3, n - 2, n - 1, n, n + 1, (n + 1) // 2,
+               1 << 128, (1 << 255), (1 << 255) + 1, (1 << 256) - 1,
+               int("55" * 32, 16), int("aa" * 32, 16)]
+    return [(k, Px, Py) for Px, Py in points for k in scalars]
+
+def random_vectors(count, seed=None):
+    """Random k against random multiples of G, reproducible from seed."""
+    rng = random.Random(seed)
+    vectors = []
+    for _ in range(count):
+        Px, Py = ecdsa_host.wnaf_scalar_mult(rng.randrange(1, ecdsa_host.n), ecdsa_host.G)
+        vectors.append((rng.randrange(1, ecdsa_host.n), Px, Py))
+    return vectors
+
+# ——— Worker side: one private sim_build per process ———
+def _run_chunk(chunk, sim, workroot):
+    """Simulate one chunk of (id, k, Px, Py) and check it against sw_scalar_mult."""
+    ecdsa_host.HW_SIM = sim
+    workdir = os.path.join(workroot, f"sim_build_{os.getpid()}")
+    start = time.perf_counter()
+    try:
+        doc = ecdsa_host.hw_scalar_mult_batch([job[1:] for job in chunk], workdir=workdir)
+    except RuntimeError as e:  # simulator/make failure: fail the chunk, keep the farm going
+        return os.getpid(), time.perf_counter() - start, [
+            {"id": job_id, "k": k, "px": Px, "py": Py, "passed": False,
+             "cycles": None, "error": str(e)} for job_id, k, Px, Py in chunk]
+    wall = time.perf_counter() - start
+
+    records = []
+    for (job_id, k, Px, Py), r in zip(chunk, doc["results"]):
+        R = ecdsa_host.sw_scalar_mult(k, (Px, Py))
+        passed = (R is None) if r["inf"] else (R == (r["x"], r["y"]))
+        records.append({"id": job_id, "k": k, "px": Px, "py": Py,
+                        "passed": passed, "cycles": r["cycles"]})
+    return os.getpid(), wall, records
+
+# ——— Host side ———
+def run_farm(vectors, workers=None, chunk_size=8, sim=None, workroot=None):
+    """
+    Spread vectors over `workers` simulator processes (one isolated
+    sim_build each, compiled once and reused for every chunk that lands
+    on it); returns a summary dict with per-vector records.
+    """
+    workers  = workers or os.cpu_count() or 1
+    sim      = sim or ecdsa_host.HW_SIM
+    workroot = os.path.abspath(workroot or os.path.join(ecdsa_host.TB_DIR, "farm"))
+    jobs     = [(i, k, Px, Py) for i, (k, Px, Py) in enumerate(vectors)]
+    chunks   = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+
+    records, per_pid = [], {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chunk, chunk, sim, workroot) for chunk in chunks]
+        for fut in as_completed(futures):
+            pid, wall, chunk_records = fut.result()
+            records.extend(chunk_records)
+            jobs_done, busy = per_pid.get(pid, (0, 0.0))
+            per_pid[pid] = (jobs_done + len(chunk_records), busy + wall)
+    elapsed = time.perf_counter() - start
+
+    records.sort(key=lambda r: r["id"])
+    cycles = [r["cycles"] for r in records if r["cycles"] is not None]
+    return {
+        "sim":         sim,
+        "workers":     workers,
+        "vectors":     len(records),
+        "passed":      sum(r["passed"] for r in records),
+        "failed":      [r for r in records if not r["passed"]],
+        "wall_s":      elapsed,
+        "vectors_per_s": len(records) / elapsed if elapsed else 0.0,
+        "cycles":      {"min": min(cycles), "avg": sum(cycles) / len(cycles),
+                        "max": max(cycles)} if cycles else {},
+        "per_worker":  {pid: {"vectors": v, "busy_s": b} for pid, (v, b) in per_pid.items()},
+        "records":     records,
+    }
+
+def print_summary(summary):
+    print(f"{summary['sim']}: {summary['passed']}/{summary['vectors']} passed "
+          f"on {summary['workers']} worker(s) in {summary['wall_s']:.2f} s "
+          f"({summary['vectors_per_s']:.2f} vectors/s)")
+    if summary["cycles"]:
+        c = summary["cycles"]
+        print(f"  cycles per k*P: min {c['min']:,}  avg {c['avg']:,.0f}  max {c['max']:,}")
+    for pid, w in sorted(summary["per_worker"].items()):
+        print(f"  pid {pid}: {w['vectors']:4d} vectors, {w['busy_s']:8.2f} s busy")
+    for r in summary["failed"]:
+        print(f"  FAIL id {r['id']}: k={hex(r['k'])} P=({hex(r['px'])}, {hex(r['py'])})"
+              + (f" [{r['error']}]" if "error" in r else ""))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel HW regression against sw_scalar_mult")
+    parser.add_argument("--random", type=int, default=32, help="number of random vectors")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--no-edge", action="store_true", help="skip the edge-case vectors")
+    parser.add_argument("--workers", type=int, nargs="+", default=[os.cpu_count() or 1],
+                        help="worker counts to run (several values give a scaling table)")
+    parser.add_argument("--chunk-size", type=int, default=8)
+    parser.add_argument("--sim", default=ecdsa_host.HW_SIM,
+                        help="cocotb SIM (questa, icarus, verilator) or 'model'")
+    parser.add_argument("--workdir", help="root for the per-worker sim_build dirs")
+    parser.add_argument("--report", help="write the last run's summary as JSON here")
+    args = parser.parse_args()
+
+    vectors = ([] if args.no_edge else edge_vectors()) + random_vectors(args.random, args.seed)
+    for workers in args.workers:
+        summary = run_farm(vectors, workers, args.chunk_size, args.sim, args.workdir)
+        print_summary(summary)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(summary, f, indent=2)
+    if summary["failed"]:
+        raise SystemExit(1)
@@ -0,0 +1,214 @@
+import argparse
+import json
+import secrets
+import time
+
+# ——— Constants shared by every RTL module ———
+P_CONST   = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+EXP_CONST = P_CONST - 2          # mod_inv exponent
+MASK      = (1 << 256) - 1       # 256-bit register width
+WIDTH     = 256
+
+# ——— Combinational units (src/mod_add.v, src/mod_sub.v) ———
+def mod_add(A, B):
+    """mod_add.v: 257-bit sum, subtract p once if sum >= p."""
+    s = A + B
+    return (s - P_CONST) & MASK if s >= P_CONST else s
+
+def mod_sub(A, B):
+    """mod_sub.v: A - B if A >= B, else p - (B - A)."""
+    return A - B if A >= B else (P_CONST - (B - A)) & MASK
+
+# ——— Sequential datapaths, bit for bit ———
+def mod_mul_shift_add(A, B):
+    """mod_mul.v datapath: 256 iterations of accum += base; base <<= 1 (mod p)."""
+    accum, base, mult = 0, A, B
+    for _ in range(WIDTH):
+        if mult & 1:
+            accum = mod_add(accum, base)
+        base = mod_add(base, base)
+        mult >>= 1
+    return accum
+
+def mod_inv_binexp(A, mul=mod_mul_shift_add):
+    """mod_inv.v datapath: LSB-first binary exponentiation A^(p-2) with mod_mul."""
+    e, x, res = EXP_CONST, A, 1
+    while e:
+        if e & 1:
+            res = mul(res, x)
+        x = mul(x, x)
+        e >>= 1
+    return res
+
+# ——— Cycle model of mod_mul / mod_inv / point_add / scalar_mul ———
+class RTLModel:
+    """
+    Cycle-approximate model of scalar_mul.v. Values follow the RTL
+    datapaths (including the stale x3/y3 that point_add leaves behind on
+    an infinity result); latencies are the FSM edge counts of each module
+    with mod_mul retiring mul_digit bits of B per cycle (1 in the RTL).
+
+    exact=False evaluates mod_mul/mod_inv in closed form, which equals
+    the shift-add datapath for operands < p (all the FSM ever produces);
+    exact=True runs mod_mul_shift_add/mod_inv_binexp literally.
+    """
+    def __init__(self, mul_digit=1, exact=False):
+        self.mul_digit = mul_digit
+        self.exact     = exact
+        self.mul_cycles = -(-WIDTH // mul_digit)   # mod_mul busy cycles
+        M = self.mul_cycles
+
+        # mod_inv: per exponent bit BIT_CHECK -> [MUL_START/WAIT] -> SQ_START/WAIT,
+        # plus IDLE->INIT->first BIT_CHECK and DONE -> caller sees done.
+        ones  = bin(EXP_CONST).count("1")
+        zeros = EXP_CONST.bit_length() - ones
+        self.inv_latency   = ones * (2 * M + 7) + zeros * (M + 4) + 5
+        self.inv_mul_cycles = (zeros + 2 * ones) * M
+
+        # point_add: start edge -> caller sees the done pulse
+        self.pa_latency = {
+            "trivial": 5,
+            "add":     self.inv_latency + 3 * M + 17,
+            "double":  self.inv_latency + 4 * M + 19,
+        }
+        self.pa_muls = {"trivial": 0, "add": 3, "double": 4}
+        self.reset()
+
+    def reset(self):
+        """rst_n: point_add output registers back to zero."""
+        self._x3 = self._y3 = 0
+
+    def _mul(self, A, B):
+        return mod_mul_shift_add(A, B) if self.exact else (A * B) % P_CONST
+
+    def _inv(self, A):
+        if self.exact:
+            return mod_inv_binexp(A, self._mul)
+        return pow(A, EXP_CONST, P_CONST)
+
+    def point_add(self, x1, y1, inf1, x2, y2, inf2):
+        """point_add.v; returns (x3, y3, inf3, path) with path a pa_latency key."""
+        is_double = not inf1 and not inf2 and x1 == x2 and y1 == y2
+        is_neg    = not inf1 and not inf2 and x1 == x2 and ((y1 + y2) & MASK) == P_CONST
+        if inf1:
+            self._x3, self._y3 = x2, y2
+            return x2, y2, inf2, "trivial"
+        if inf2:
+            self._x3, self._y3 = x1, y1
+            return x1, y1, inf1, "trivial"
+        if is_neg:
+            return self._x3, self._y3, 1, "trivial"
+
+        if is_double:
+            x1_sq = self._mul(x1, x1)
+            num = mod_add(mod_add(x1_sq, x1_sq), x1_sq)
+            den = mod_add(y1, y1)
+        else:
+            num = mod_sub(y2, y1)
+            den = mod_sub(x2, x1)
+        lam = self._mul(num, self._inv(den))
+        x3  = mod_sub(self._mul(lam, lam), mod_add(x1, x2))
+        y3  = mod_sub(self._mul(lam, mod_sub(x1, x3)), y1)
+        self._x3, self._y3 = x3, y3
+        return x3, y3, 0, "double" if is_double else "add"
+
+    def scalar_mul(self, k, Px, Py, Pinf=0):
+        """
+        scalar_mul.v: LSB-first, R += P when the bit is set, P = 2P always,
+        for bit_index 255..0; the loop exits on the first point_add done with
+        bit_index == 0, so a set bit 255 skips the final doubling. Returns
+        (X, Y, inf, perf) like run_job in tb/test_hw_sign.py.
+        """
+        perf = {"cycles": 0, "point_add_cycles": 0, "mod_inv_cycles": 0,
+                "mod_mul_cycles": 0, "inv_mod_mul_cycles": 0,
+                "point_adds": 0, "inversions": 0}
+
+        def run(x1, y1, inf1, x2, y2, inf2):
+            x3, y3, inf3, path = self.point_add(x1, y1, inf1, x2, y2, inf2)
+            latency = self.pa_latency[path]
+            perf["point_adds"]       += 1
+            perf["point_add_cycles"] += latency - 1
+            perf["mod_mul_cycles"]   += self.pa_muls[path] * self.mul_cycles
+            if path != "trivial":
+                perf["inversions"]         += 1
+                perf["mod_inv_cycles"]     += self.inv_latency - 1
+                perf["inv_mod_mul_cycles"] += self.inv_mul_cycles
+            return x3, y3, inf3, latency
+
+        t = 2                                   # start edge (IDLE), INIT
+        R_x, R_y, R_inf = 0, 0, 1
+        C_x, C_y, C_inf = Px, Py, Pinf
+        scalar = k & MASK
+        for bit_index in range(WIDTH - 1, -1, -1):
+            t += 1                              # A_IDLE
+            if scalar & 1:
+                R_x, R_y, R_inf, latency = run(R_x, R_y, R_inf, C_x, C_y, C_inf)
+                t += latency                    # A_ADD_WAIT
+                if bit_index == 0:
+                    break
+            t += 1                              # A_DBL_START
+            C_x, C_y, C_inf, latency = run(C_x, C_y, C_inf, C_x, C_y, C_inf)
+            t += latency                        # A_DBL_WAIT
+            scalar >>= 1
+        perf["cycles"] = t + 1                  # DONE_STATE
+        return R_x, R_y, R_inf, perf
+
+MODEL = RTLModel()
+
+# ——— Drop-in backends for ecdsa_host ———
+def hw_scalar_mult(k: int, Px: int, Py: int) -> tuple:
+    """Same contract as ecdsa_host.hw_scalar_mult, answered by MODEL."""
+    X, Y, inf, _ = MODEL.scalar_mul(k, Px, Py)
+    if inf:
+        raise ValueError("Output point is at infinity")
+    return (X, Y)
+
+def hw_scalar_mult_batch(jobs, model=None):
+    """Same results document as the run_hw_batch cocotb test."""
+    model = model or MODEL
+    model.reset()
+    results = []
+    for job_id, (k, Px, Py) in enumerate(jobs):
+        X, Y, inf, perf = model.scalar_mul(k, Px, Py)
+        results.append({"id": job_id, "k": k, "px": Px, "py": Py,
+                        "x": X, "y": Y, "inf": inf, **perf})
+    total = sum(r["cycles"] for r in results)
+    return {
+        "jobs":         len(results),
+        "total_cycles": total,
+        "avg_cycles":   total / len(results) if results else 0,
+        "results":      results,
+    }
+
+if __name__ == "__main__":
+    import ecdsa_host
+
+    parser = argparse.ArgumentParser(description="Cycle model of the HW scalar multiplier")
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--mul-digit", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+                        help="mod_mul bits retired per cycle (RTL: 1)")
+    parser.add_argument("--clock-mhz", type=float, default=100.0)
+    parser.add_argument("--exact", action="store_true",
+                        help="run the shift-add mod_mul/mod_inv datapaths literally (slow)")
+    parser.add_argument("--results", help="write the mul_digit=1 run_hw_batch-style JSON here")
+    args = parser.parse_args()
+
+    jobs = [(secrets.randbelow(ecdsa_host.n - 1) + 1, ecdsa_host.Gx, ecdsa_host.Gy)
+            for _ in range(args.jobs)]
+    expected = [ecdsa_host.sw_scalar_mult(k, (Px, Py)) for k, Px, Py in jobs]
+
+    print(f"{'mul_digit':>9} | {'cycles/k*P':>12} | {'inv cycles':>10} | "
+          f"{'ms/op @' + format(args.clock_mhz, 'g') + 'MHz':>14} | {'model s/op':>10} | match")
+    print("-" * 78)
+    for digit in args.mul_digit:
+        model = RTLModel(mul_digit=digit, exact=args.exact)
+        start = time.perf_counter()
+        doc = hw_scalar_mult_batch(jobs, model)
+        elapsed = (time.perf_counter() - start) / len(jobs)
+        match = all((r["x"], r["y"]) == R for r, R in zip(doc["results"], expected))
+        hw_ms = doc["avg_cycles"] / (args.clock_mhz * 1e3)
+        print(f"{digit:>9} | {doc['avg_cycles']:>12,.0f} | {model.inv_latency:>10,} | "
+              f"{hw_ms:>14.3f} | {elapsed:>10.4f} | {match}")
+        if digit == 1 and args.results:
+            with open(args.results, "w") as f:
+                json.dump(doc, f)
@@ -0,0 +1,82 @@
+import argparse
+import csv
+import json
+import secrets
+import time
+
+import ecdsa_host
+
+# ——— Cycle report for the HW scalar multiplier ———
+# Reads a run_hw_batch results document (or produces one by running
+# random jobs through the simulator), projects HW throughput at a given
+# clock frequency and compares it with the measured SW scalar_mult time.
+PHASES = ["point_add_cycles", "mod_inv_cycles", "mod_mul_cycles", "inv_mod_mul_cycles"]
+COUNTS = ["point_adds", "inversions"]
+
+def sw_time_per_op(fn, jobs):
+    start = time.perf_counter()
+    for k, Px, Py in jobs:
+        fn(k, (Px, Py))
+    return (time.perf_counter() - start) / len(jobs)
+
+def write_csv(path, results, clock_mhz):
+    fields = ["id", "k", "cycles", "time_us"] + PHASES + COUNTS + ["match"]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for r in results:
+            row = {name: r.get(name) for name in fields}
+            row["k"] = hex(r["k"])
+            row["time_us"] = r["cycles"] / clock_mhz
+            writer.writerow(row)
+
+def report(doc, clock_mhz, csv_path):
+    results = doc["results"]
+    jobs = [(r["k"], r["px"], r["py"]) for r in results]
+    for r, (k, Px, Py) in zip(results, jobs):
+        R = ecdsa_host.sw_scalar_mult(k, (Px, Py))
+        r["match"] = (R is None) if r["inf"] else (R == (r["x"], r["y"]))
+    write_csv(csv_path, results, clock_mhz)
+
+    avg_cycles = sum(r["cycles"] for r in results) / len(results)
+    hw_s       = avg_cycles / (clock_mhz * 1e6)
+    sw_affine  = sw_time_per_op(ecdsa_host.sw_scalar_mult, jobs)
+    sw_best    = sw_time_per_op(ecdsa_host.SW_STRATEGIES[ecdsa_host.SW_STRATEGY], jobs)
+
+    print(f"Jobs:                    {len(results)} "
+          f"({sum(r['match'] for r in results)} match sw_scalar_mult)")
+    print(f"Avg cycles per k*P:      {avg_cycles:,.0f}")
+    for name in PHASES:
+        vals = [r.get(name) for r in results]
+        if None in vals:
+            print(f"  {name:22} n/a (internal signals not visible)")
+            continue
+        avg = sum(vals) / len(vals)
+        print(f"  {name:22} {avg:>14,.0f}  ({avg / avg_cycles:6.2%})")
+    for name in COUNTS:
+        vals = [r.get(name) for r in results]
+        if None not in vals:
+            print(f"  {name:22} {sum(vals) / len(vals):>14.1f} per k*P")
+    print(f"\nProjected HW @ {clock_mhz:g} MHz: {hw_s * 1e3:.3f} ms/op, {1 / hw_s:,.1f} ops/s")
+    print(f"SW sw_scalar_mult:       {sw_affine * 1e3:.3f} ms/op, {1 / sw_affine:,.1f} ops/s")
+    print(f"SW {ecdsa_host.SW_STRATEGY + ':':22}{sw_best * 1e3:.3f} ms/op, {1 / sw_best:,.1f} ops/s")
+    print(f"HW cycles-equivalent of sw_scalar_mult: {sw_affine * clock_mhz * 1e6:,.0f}")
+    print(f"\nPer-job CSV written to {csv_path}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cycle report for the HW scalar multiplier")
+    parser.add_argument("--results", help="existing run_hw_batch results JSON")
+    parser.add_argument("--jobs", type=int, default=8,
+                        help="random jobs to simulate when --results is not given")
+    parser.add_argument("--clock-mhz", type=float, default=100.0)
+    parser.add_argument("--csv", default="hw_perf.csv")
+    args = parser.parse_args()
+
+    if args.results:
+        with open(args.results) as f:
+            doc = json.load(f)
+    else:
+        doc = ecdsa_host.hw_scalar_mult_batch(
+            [(secrets.randbelow(ecdsa_host.n - 1) + 1, ecdsa_host.Gx, ecdsa_host.Gy)
+             for _ in range(args.jobs)])
+    report(doc, args.clock_mhz, args.csv)
@@ -1,4 +1,7 @@
+import json
+import mmap
 import os
+import socket
 import cocotb
 from cocotb.triggers import RisingEdge, Timer
 
@@ -9,12 +12,7 @@ async def clock_gen(clk):
         clk.value = 1
         await Timer(5, units="ns")
 
-async def hw_scalar_mult(dut) -> tuple:
-    # Parse inputs from environment variables
-    k = int(os.getenv("K_SCALAR"))
-    Px = int(os.getenv("PX"))
-    Py = int(os.getenv("PY"))
-
+async def reset_dut(dut):
     # Ensure clock is running
     cocotb.start_soon(clock_gen(dut.clk))
 
@@ -24,6 +22,57 @@ async def hw_scalar_mult(dut) -> tuple:
     dut.rst_n.value = 1
     for _ in range(2): await RisingEdge(dut.clk)
 
+# ——— Performance monitors ———
+# Sampled once per clock edge while a job runs. Phase counters watch the
+# internal FSMs/handshakes of point_add and mod_inv; they are left at
+# None when the simulator does not expose those signals (e.g. Verilator
+# without --public).
+def _handle(dut, path):
+    obj = dut
+    try:
+        for name in path.split("."):
+            obj = getattr(obj, name)
+    except AttributeError:
+        return None
+    return obj
+
+class PerfMonitor:
+    PHASES = {
+        "point_add_cycles":   "u_point_add.state",
+        "mod_inv_cycles":     "u_point_add.u_mod_inv.state",
+        "mod_mul_cycles":     "u_point_add.u_mod_mul.busy",
+        "inv_mod_mul_cycles": "u_point_add.u_mod_inv.u_mod_mul.busy",
+    }
+    PULSES = {
+        "point_adds": "pa_start",
+        "inversions": "u_point_add.inv_start",
+    }
+
+    def __init__(self, dut):
+        self.dut = dut
+        self.signals = {name: _handle(dut, path)
+                        for name, path in {**self.PHASES, **self.PULSES}.items()}
+        self.counts = {name: (0 if sig is not None else None)
+                       for name, sig in self.signals.items()}
+
+    def sample(self):
+        for name, sig in self.signals.items():
+            if sig is None:
+                continue
+            try:
+                if int(sig.value) != 0:
+                    self.counts[name] += 1
+            except ValueError:  # X/Z right after reset
+                pass
+
+async def run_job(dut, k, Px, Py):
+    """
+    Run one k*P on an already reset, idle DUT; returns (X, Y, inf, perf)
+    where perf["cycles"] counts clock edges from start to done, next to
+    the PerfMonitor phase cycles and point_add/inversion counts.
+    """
+    monitor = PerfMonitor(dut)
+
     # Apply inputs
     dut.k.value = k
     dut.Px.value = Px
@@ -33,15 +82,26 @@ async def hw_scalar_mult(dut) -> tuple:
 
     await RisingEdge(dut.clk)
     dut.start.value = 0
+    cycles = 1
 
     # Wait for done signal
     while dut.done.value != 1:
         await RisingEdge(dut.clk)
+        monitor.sample()
+        cycles += 1
 
     # Read outputs
-    X = int(dut.Xout.value)
-    Y = int(dut.Yout.value)
-    inf = int(dut.inf_out.value)
+    perf = {"cycles": cycles, **monitor.counts}
+    return int(dut.Xout.value), int(dut.Yout.value), int(dut.inf_out.value), perf
+
+async def hw_scalar_mult(dut) -> tuple:
+    # Parse inputs from environment variables
+    k = int(os.getenv("K_SCALAR"))
+    Px = int(os.getenv("PX"))
+    Py = int(os.getenv("PY"))
+
+    await reset_dut(dut)
+    X, Y, inf, _ = await run_job(dut, k, Px, Py)
 
     if inf:
         raise ValueError("Output point is at infinity")
@@ -54,3 +114,67 @@ async def hw_scalar_mult(dut) -> tuple:
 @cocotb.test()
 async def run_hw_scalar_mult(dut):
     await hw_scalar_mult(dut)
+
+@cocotb.test()
+async def run_hw_server(dut):
+    """
+    Persistent session: connect to the host at HW_SERVER_ADDR (host:port),
+    then serve newline-delimited JSON jobs {"id", "k", "px", "py"} back to
+    back on one reset DUT, answering each with {"id", "x", "y", "inf",
+    "perf"}, until the host sends {"quit": true} or closes the connection.
+    """
+    addr = os.getenv("HW_SERVER_ADDR")
+    if not addr:
+        return
+    host, port = addr.rsplit(":", 1)
+
+    await reset_dut(dut)
+    with socket.create_connection((host, int(port))) as conn:
+        rfile = conn.makefile("r")
+        wfile = conn.makefile("w")
+        for line in rfile:
+            job = json.loads(line)
+            if job.get("quit"):
+                break
+            X, Y, inf, perf = await run_job(dut, job["k"], job["px"], job["py"])
+            wfile.write(json.dumps({"id": job["id"], "x": X, "y": Y, "inf": inf,
+                                    "perf": perf}) + "\n")
+            wfile.flush()
+
+def read_jobs(path):
+    """Yield JSON-lines jobs {"k", "px", "py"} from a memory-mapped file."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if line.strip():
+                    yield json.loads(line)
+
+@cocotb.test()
+async def run_hw_batch(dut):
+    """
+    Batch mode: run every job in HW_JOBS_FILE back to back after a single
+    reset and write one JSON document to HW_RESULTS_FILE with per-job
+    results and PerfMonitor counters plus batch totals.
+    """
+    jobs_path = os.getenv("HW_JOBS_FILE")
+    if not jobs_path:
+        return
+    results_path = os.getenv("HW_RESULTS_FILE", "hw_results.json")
+
+    await reset_dut(dut)
+    results = []
+    for job_id, job in enumerate(read_jobs(jobs_path)):
+        X, Y, inf, perf = await run_job(dut, job["k"], job["px"], job["py"])
+        results.append({"id": job.get("id", job_id), "k": job["k"], "px": job["px"],
+                        "py": job["py"], "x": X, "y": Y, "inf": inf, **perf})
+
+    total = sum(r["cycles"] for r in results)
+    with open(results_path, "w") as f:
+        json.dump({
+            "jobs":         len(results),
+            "total_cycles": total,
+            "avg_cycles":   total / len(results) if results else 0,
+            "results":      results,
+        }, f)
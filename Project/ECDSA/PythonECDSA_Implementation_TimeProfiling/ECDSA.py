@@ -1,5 +1,16 @@
+import atexit
+import functools
 import hashlib
+import json
+import mmap
+import os
 import secrets
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+from secp256k1_field import fe_batch_inv, fe_inv
 
 # ——— Domain parameters for secp256k1 ———
 p  = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
@@ -16,6 +27,25 @@ n  = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
 def inv_mod(k, m):
     return pow(k, -1, m)
 
+def batch_inv_mod(values, m):
+    """
+    Montgomery's trick: invert every (non-zero) value mod m with a single
+    inv_mod and three multiplications per element.
+    """
+    prefix = []
+    acc = 1
+    for v in values:
+        acc = (acc * v) % m
+        prefix.append(acc)
+    inv = inv_mod(acc, m)
+    out = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        out[i] = (inv * prefix[i - 1]) % m
+        inv = (inv * values[i]) % m
+    if values:
+        out[0] = inv
+    return out
+
 def is_on_curve(P):
     if P is None:
         return True
@@ -30,13 +60,111 @@ def point_add(P, Q):
     if x1 == x2 and (y1 + y2) % p == 0:
         return None
     if P != Q:
-        lam = ((y2 - y1) * inv_mod(x2 - x1, p)) % p
+        lam = ((y2 - y1) * fe_inv(x2 - x1)) % p
     else:
-        lam = ((3*x1*x1 + a) * inv_mod(2*y1, p)) % p
+        lam = ((3*x1*x1 + a) * fe_inv(2*y1)) % p
     x3 = (lam*lam - x1 - x2) % p
     y3 = (lam*(x1 - x3) - y1) % p
     return (x3, y3)
 
+# ——— Jacobian-coordinate point ops ———
+# A Jacobian point (X, Y, Z) stands for the affine point (X/Z^2, Y/Z^3).
+# Adds and doubles need no inversion; only from_jacobian() pays for one.
+# The point at infinity is None, same as in the affine routines above.
+def to_jacobian(P):
+    if P is None:
+        return None
+    x, y = P
+    return (x, y, 1)
+
+def from_jacobian(J):
+    if J is None:
+        return None
+    X, Y, Z = J
+    z_inv  = fe_inv(Z)
+    z_inv2 = (z_inv * z_inv) % p
+    return ((X * z_inv2) % p, (Y * z_inv2 * z_inv) % p)
+
+def batch_from_jacobian(points):
+    """from_jacobian over a list, sharing one inversion via fe_batch_inv."""
+    live = [J for J in points if J is not None]
+    z_invs = iter(fe_batch_inv([J[2] for J in live]))
+    out = []
+    for J in points:
+        if J is None:
+            out.append(None)
+            continue
+        X, Y, _ = J
+        z_inv  = next(z_invs)
+        z_inv2 = (z_inv * z_inv) % p
+        out.append(((X * z_inv2) % p, (Y * z_inv2 * z_inv) % p))
+    return out
+
+def jacobian_double(J):
+    if J is None:
+        return None
+    X, Y, Z = J
+    if Y == 0:
+        return None
+    YY = (Y * Y) % p
+    S  = (4 * X * YY) % p
+    M  = (3 * X * X) % p  # a = 0 on secp256k1, so no a*Z^4 term
+    X3 = (M * M - 2 * S) % p
+    Y3 = (M * (S - X3) - 8 * YY * YY) % p
+    Z3 = (2 * Y * Z) % p
+    return (X3, Y3, Z3)
+
+def jacobian_add(J1, J2):
+    if J1 is None: return J2
+    if J2 is None: return J1
+    X1, Y1, Z1 = J1
+    X2, Y2, Z2 = J2
+    Z1Z1 = (Z1 * Z1) % p
+    Z2Z2 = (Z2 * Z2) % p
+    U1 = (X1 * Z2Z2) % p
+    U2 = (X2 * Z1Z1) % p
+    S1 = (Y1 * Z2 * Z2Z2) % p
+    S2 = (Y2 * Z1 * Z1Z1) % p
+    H  = (U2 - U1) % p
+    R  = (S2 - S1) % p
+    if H == 0:
+        if R == 0:
+            return jacobian_double(J1)
+        return None
+    HH  = (H * H) % p
+    HHH = (H * HH) % p
+    V   = (U1 * HH) % p
+    X3 = (R * R - HHH - 2 * V) % p
+    Y3 = (R * (V - X3) - S1 * HHH) % p
+    Z3 = (H * Z1 * Z2) % p
+    return (X3, Y3, Z3)
+
+def jacobian_add_mixed(J, Q):
+    """
+    Mixed addition J + Q where Q is affine (implicit Z = 1), which saves
+    the Z2 products of the general jacobian_add.
+    """
+    if Q is None: return J
+    if J is None: return to_jacobian(Q)
+    X1, Y1, Z1 = J
+    x2, y2 = Q
+    Z1Z1 = (Z1 * Z1) % p
+    U2 = (x2 * Z1Z1) % p
+    S2 = (y2 * Z1 * Z1Z1) % p
+    H  = (U2 - X1) % p
+    R  = (S2 - Y1) % p
+    if H == 0:
+        if R == 0:
+            return jacobian_double(J)
+        return None
+    HH  = (H * H) % p
+    HHH = (H * HH) % p
+    V   = (X1 * HH) % p
+    X3 = (R * R - HHH - 2 * V) % p
+    Y3 = (R * (V - X3) - Y1 * HHH) % p
+    Z3 = (H * Z1) % p
+    return (X3, Y3, Z3)
+
 # Hardware-based scalar multiplication (to be integrated with RTL/Cocotb)
 def hw_scalar_mult(k, Px, Py):
     raise NotImplementedError("This function must call your RTL scalar_mul module via cocotb or other means")
@@ -52,18 +180,495 @@ def sw_scalar_mult(k, P):
         k >>= 1
     return result
 
+# Jacobian scalar multiplication: left-to-right double-and-add with mixed
+# additions of the affine base point, one inversion for the whole ladder.
+def jacobian_scalar_mult(k, P):
+    if P is None:
+        return None
+    R = None
+    for bit in bin(k)[2:]:
+        R = jacobian_double(R)
+        if bit == "1":
+            R = jacobian_add_mixed(R, P)
+    return from_jacobian(R)
+
+# ——— Fixed-base precomputation for G ———
+# Row i of the table holds j * 2^(w*i) * G (affine) for j = 1 .. 2^w - 1, so
+# k*G is one table lookup and one mixed addition per w-bit window of k,
+# with no doublings at all. The table is built lazily on first use and, if
+# COMB_TABLE_PATH is set, cached on disk as JSON for later processes.
+COMB_WINDOW     = 6
+COMB_TABLE_PATH = os.environ.get("ECDSA_COMB_TABLE")  # None disables caching
+_comb_table     = None
+
+def build_comb_table(P=G, w=COMB_WINDOW):
+    rows = []
+    base = P
+    for _ in range((n.bit_length() + w - 1) // w):
+        row = [to_jacobian(base)]
+        for _ in range(2, 1 << w):
+            row.append(jacobian_add_mixed(row[-1], base))
+        rows.append(batch_from_jacobian(row))
+        J = to_jacobian(base)
+        for _ in range(w):
+            J = jacobian_double(J)
+        base = from_jacobian(J)
+    return rows
+
+def _comb_digest(rows):
+    return hashlib.sha256(json.dumps(rows).encode()).hexdigest()
+
+def save_comb_table(path, table, w=COMB_WINDOW):
+    """Write to a temp file next to path and rename it into place, so
+    concurrent readers see either no file or a complete one."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"window": w, "G": list(G), "sha256": _comb_digest(table), "rows": table}, f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def load_comb_table(path, w=COMB_WINDOW):
+    """
+    Load and check a cached table: its SHA-256 over all rows must match,
+    and it must hold ceil(256/w) rows of 2^w - 1 points, all on the curve,
+    with row i running from 2^(w*i) * G to (2^w - 1) * 2^(w*i) * G.
+    Raises ValueError on any mismatch.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if data["window"] != w or tuple(data["G"]) != G:
+        raise ValueError(f"{path} holds a table for a different window or base point")
+    if _comb_digest(data["rows"]) != data["sha256"]:
+        raise ValueError(f"{path} does not match its stored digest")
+    rows = [[tuple(pt) for pt in row] for row in data["rows"]]
+    if len(rows) != (n.bit_length() + w - 1) // w or any(len(row) != (1 << w) - 1 for row in rows):
+        raise ValueError(f"{path} has the wrong table shape")
+    J = to_jacobian(G)
+    for i, row in enumerate(rows):
+        if any(len(pt) != 2 or not is_on_curve(pt) for pt in row):
+            raise ValueError(f"{path} row {i} holds a point off the curve")
+        if row[0] != from_jacobian(J):
+            raise ValueError(f"{path} row {i} does not start at 2^{w * i} * G")
+        for _ in range(w):
+            J = jacobian_double(J)
+        # last entry + first entry must land on the next row's base, 2^w times this one
+        if from_jacobian(jacobian_add_mixed(to_jacobian(row[-1]), row[0])) != from_jacobian(J):
+            raise ValueError(f"{path} row {i} does not end at (2^{w} - 1) * 2^{w * i} * G")
+    return rows
+
+def get_comb_table():
+    global _comb_table
+    if _comb_table is None:
+        if COMB_TABLE_PATH and os.path.exists(COMB_TABLE_PATH):
+            try:
+                _comb_table = load_comb_table(COMB_TABLE_PATH, COMB_WINDOW)
+            except (OSError, ValueError, KeyError, TypeError):
+                _comb_table = None  # torn, stale or edited cache: rebuild below
+        if _comb_table is None:
+            _comb_table = build_comb_table(G, COMB_WINDOW)
+            if COMB_TABLE_PATH:
+                save_comb_table(COMB_TABLE_PATH, _comb_table, COMB_WINDOW)
+    return _comb_table
+
+def fixed_base_scalar_mult(k):
+    table = get_comb_table()
+    k %= n
+    mask = (1 << COMB_WINDOW) - 1
+    R = None
+    for row in table:
+        digit = k & mask
+        if digit:
+            R = jacobian_add_mixed(R, row[digit - 1])
+        k >>= COMB_WINDOW
+    return from_jacobian(R)
+
+# ——— Simultaneous double-scalar multiplication (Shamir / Straus) ———
+# u1*P + u2*Q walks a single shared chain of doublings instead of two.
+# "window" interleaves sliding-window recodings of both scalars against
+# tables of odd multiples; "jsf" uses the joint sparse form with the four
+# points P, Q, P+Q, P-Q (and their negatives); "glv" splits both scalars
+# with the secp256k1 endomorphism (see below) and interleaves four
+# half-length windows.
+SHAMIR_WINDOW   = 4
+SHAMIR_G_WINDOW = 7      # G's table is cached, so it can afford a wider window
+SHAMIR_METHOD   = "glv"  # or "window" / "jsf"
+_g_odd_table    = {}     # window -> odd multiples of G
+
+def point_neg(P):
+    if P is None:
+        return None
+    x, y = P
+    return (x, (-y) % p)
+
+def odd_multiples(P, w):
+    """Affine [P, 3P, 5P, ..., (2^w - 1)P]."""
+    table = [to_jacobian(P)]
+    twoP = jacobian_double(table[0])
+    for _ in range((1 << (w - 1)) - 1):
+        table.append(jacobian_add(table[-1], twoP))
+    return batch_from_jacobian(table)
+
+def sliding_window_digits(k, w):
+    """
+    LSB-first digits d_i of k = sum(d_i * 2^i), each 0 or odd below 2^w,
+    with at least w-1 zeros between non-zero digits.
+    """
+    digits = []
+    while k:
+        if k & 1:
+            d = k & ((1 << w) - 1)
+            digits.append(d)
+            digits.extend([0] * (w - 1))
+            k >>= w
+        else:
+            digits.append(0)
+            k >>= 1
+    return digits
+
+def joint_sparse_form(k0, k1):
+    """LSB-first JSF digit pairs (u0, u1) in {-1, 0, 1} of k0 and k1."""
+    digits = []
+    d0 = d1 = 0
+    while k0 + d0 > 0 or k1 + d1 > 0:
+        l0, l1 = d0 + k0, d1 + k1
+        u0 = u1 = 0
+        if l0 & 1:
+            u0 = 1 if l0 % 4 == 1 else -1
+            if l0 % 8 in (3, 5) and l1 % 4 == 2:
+                u0 = -u0
+        if l1 & 1:
+            u1 = 1 if l1 % 4 == 1 else -1
+            if l1 % 8 in (3, 5) and l0 % 4 == 2:
+                u1 = -u1
+        if 2 * d0 == 1 + u0:
+            d0 = 1 - d0
+        if 2 * d1 == 1 + u1:
+            d1 = 1 - d1
+        k0 >>= 1
+        k1 >>= 1
+        digits.append((u0, u1))
+    return digits
+
+# ——— Per-public-key table cache ———
+class PubKeyTableCache:
+    """
+    LRU cache of odd-multiple tables keyed by (public key, window), so hot
+    verifying keys skip table construction. Bounded both by entry count
+    and by an estimate of the memory the tables hold.
+    """
+    def __init__(self, max_entries=512, max_bytes=16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self._tables     = OrderedDict()
+        self.bytes       = 0
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def _table_size(table):
+        size = sys.getsizeof(table)
+        for pt in table:
+            size += sys.getsizeof(pt) + sys.getsizeof(pt[0]) + sys.getsizeof(pt[1])
+        return size
+
+    def get(self, pub, w):
+        key = (pub, w)
+        entry = self._tables.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._tables.move_to_end(key)
+            return entry[0]
+        self.misses += 1
+        table = odd_multiples(pub, w)
+        if self.max_entries <= 0:
+            return table
+        size = self._table_size(table)
+        self._tables[key] = (table, size)
+        self.bytes += size
+        while self._tables and (len(self._tables) > self.max_entries
+                                or self.bytes > self.max_bytes):
+            _, (_, old_size) = self._tables.popitem(last=False)
+            self.bytes -= old_size
+            self.evictions += 1
+        return table
+
+    def clear(self):
+        self._tables.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {
+            "entries":   len(self._tables),
+            "bytes":     self.bytes,
+            "hits":      self.hits,
+            "misses":    self.misses,
+            "evictions": self.evictions,
+        }
+
+# Shared by verify() and verify_batch(); PUB_TABLE_CACHE.stats() for counters
+PUB_TABLE_CACHE = PubKeyTableCache()
+
+def _straus(terms):
+    """
+    Jacobian sum of k_i * P_i over terms (k_i >= 0, odd multiples of P_i,
+    window w_i), all sharing one doubling chain.
+    """
+    recoded = [(sliding_window_digits(k, w), table) for k, table, w in terms]
+    R = None
+    for i in reversed(range(max(len(digits) for digits, _ in recoded))):
+        R = jacobian_double(R)
+        for digits, table in recoded:
+            if i < len(digits) and digits[i]:
+                R = jacobian_add_mixed(R, table[digits[i] >> 1])
+    return R
+
+def _base_table(P, w):
+    """Odd multiples of P and their window; G's come from a cached wider table."""
+    if P == G:
+        if SHAMIR_G_WINDOW not in _g_odd_table:
+            _g_odd_table[SHAMIR_G_WINDOW] = odd_multiples(G, SHAMIR_G_WINDOW)
+        return _g_odd_table[SHAMIR_G_WINDOW], SHAMIR_G_WINDOW
+    return odd_multiples(P, w), w
+
+def _shamir_window(k1, P, k2, Q, w, TQ=None):
+    TP, w1 = _base_table(P, w)
+    if TQ is None:
+        TQ = PUB_TABLE_CACHE.get(Q, w)
+    return _straus([(k1, TP, w1), (k2, TQ, w)])
+
+def _shamir_jsf(k1, P, k2, Q):
+    PQ  = point_add(P, Q)
+    PmQ = point_add(P, point_neg(Q))
+    table = {
+        (1, 0): P,    (0, 1): Q,    (1, 1): PQ,   (1, -1): PmQ,
+    }
+    for (i, j), pt in list(table.items()):
+        table[(-i, -j)] = point_neg(pt)
+    R = None
+    for u in reversed(joint_sparse_form(k1, k2)):
+        R = jacobian_double(R)
+        if u != (0, 0):
+            R = jacobian_add_mixed(R, table[u])
+    return R
+
+def double_scalar_mult(k1, P, k2, Q):
+    """k1*P + k2*Q with one shared doubling chain."""
+    if P is None: k1 = 0
+    if Q is None: k2 = 0
+    if k1 == 0: return SW_STRATEGIES[SW_STRATEGY](k2, Q) if k2 else None
+    if k2 == 0: return SW_STRATEGIES[SW_STRATEGY](k1, P)
+    return from_jacobian(_double_scalar_jacobian(k1, P, k2, Q))
+
+def _double_scalar_jacobian(k1, P, k2, Q, TQ=None):
+    """k1*P + k2*Q in Jacobian form, by SHAMIR_METHOD; TQ is Q's table if known."""
+    if SHAMIR_METHOD == "jsf":
+        return _shamir_jsf(k1, P, k2, Q)
+    if SHAMIR_METHOD == "glv":
+        return _shamir_glv(k1, P, k2, Q, TQ)
+    return _shamir_window(k1, P, k2, Q, SHAMIR_WINDOW, TQ)
+
+# ——— wNAF scalar multiplication ———
+# Width-w non-adjacent form: signed odd digits |d| < 2^(w-1), at most one
+# non-zero digit in any w consecutive positions, so about 256/(w+1)
+# additions per scalar instead of 128. Negative digits add -T[|d|], and
+# negating an affine point only flips y.
+WNAF_WINDOW = 4
+
+def wnaf_digits(k, w):
+    """LSB-first wNAF digits of k >= 0."""
+    digits = []
+    full = 1 << w
+    half = 1 << (w - 1)
+    while k:
+        if k & 1:
+            d = k & (full - 1)
+            if d >= half:
+                d -= full
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+def wnaf_scalar_mult(k, P, w=None):
+    if P is None:
+        return None
+    w = WNAF_WINDOW if w is None else w
+    table = odd_multiples(P, w - 1)
+    neg   = [point_neg(T) for T in table]
+    R = None
+    for d in reversed(wnaf_digits(k, w)):
+        R = jacobian_double(R)
+        if d > 0:
+            R = jacobian_add_mixed(R, table[d >> 1])
+        elif d < 0:
+            R = jacobian_add_mixed(R, neg[(-d) >> 1])
+    return from_jacobian(R)
+
+# ——— GLV endomorphism (secp256k1) ———
+# phi(x, y) = (beta*x, y) equals lambda*(x, y) for every curve point, so
+# k*P = k1*P + k2*phi(P) with k = k1 + k2*lambda (mod n). Splitting k
+# against a short lattice basis leaves |k1|, |k2| around 2^128, and the
+# two halves share a 128-step doubling chain. phi of a table of odd
+# multiples is just one multiplication per entry.
+GLV_BETA   = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+GLV_LAMBDA = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+# Short basis (a1, b1), (a2, b2) of the lattice {(x, y) : x + y*lambda = 0 mod n}
+GLV_A1 = 0x3086D221A7D46BCDE86C90E49284EB15
+GLV_B1 = -0xE4437ED6010E88286F547FA90ABFE4C3
+GLV_A2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+GLV_B2 = 0x3086D221A7D46BCDE86C90E49284EB15
+GLV_WINDOW = 5
+
+def glv_endomorphism(P):
+    if P is None:
+        return None
+    x, y = P
+    return ((GLV_BETA * x) % p, y)
+
+def glv_split(k):
+    """(k1, k2), possibly negative, with k = k1 + k2*GLV_LAMBDA (mod n)."""
+    k %= n
+    c1 = (GLV_B2 * k + n // 2) // n
+    c2 = (-GLV_B1 * k + n // 2) // n
+    k1 = k - c1 * GLV_A1 - c2 * GLV_A2
+    k2 = -c1 * GLV_B1 - c2 * GLV_B2
+    return k1, k2
+
+def _glv_terms(k, table, w):
+    """_straus terms for k*P, given P's odd multiples for window w."""
+    k1, k2 = glv_split(k)
+    phi = [glv_endomorphism(T) for T in table]
+    return [
+        (abs(k1), table if k1 >= 0 else [point_neg(T) for T in table], w),
+        (abs(k2), phi   if k2 >= 0 else [point_neg(T) for T in phi],   w),
+    ]
+
+def glv_scalar_mult(k, P):
+    if P is None:
+        return None
+    return from_jacobian(_straus(_glv_terms(k, odd_multiples(P, GLV_WINDOW), GLV_WINDOW)))
+
+def _shamir_glv(k1, P, k2, Q, TQ=None):
+    TP, w1 = _base_table(P, GLV_WINDOW)
+    if TQ is None:
+        TQ = PUB_TABLE_CACHE.get(Q, SHAMIR_WINDOW)
+    return _straus(_glv_terms(k1, TP, w1) + _glv_terms(k2, TQ, SHAMIR_WINDOW))
+
+# ——— Co-Z Montgomery ladder (uniform per-bit work) ———
+# R0, R1 share one Z and satisfy R1 - R0 = P throughout. Every bit runs
+# the same XYcZ-ADDC + XYcZ-ADD pair on conditionally swapped registers,
+# and k is lifted to k + n or k + 2n so the loop always has 256 steps.
+# Python integers are not constant-time themselves; what this removes is
+# the data-dependent sequence of operations and point-equality branches.
+def _cswap(bit, A, B):
+    mask = -bit
+    t = mask & (A ^ B)
+    return A ^ t, B ^ t
+
+def _xycz_add(X1, Y1, X2, Y2):
+    """P1 + P2 and P1 rescaled to the new Z, which is Z * (X1 - X2)."""
+    C  = (X1 - X2) * (X1 - X2) % p
+    W1 = X1 * C % p
+    W2 = X2 * C % p
+    A1 = Y1 * (W1 - W2) % p
+    D  = Y1 - Y2
+    X3 = (D * D - W1 - W2) % p
+    return X3, (D * (W1 - X3) - A1) % p, W1, A1
+
+def _xycz_addc(X1, Y1, X2, Y2):
+    """P1 + P2 and P1 - P2, co-Z; the new Z is Z * (X1 - X2)."""
+    C  = (X1 - X2) * (X1 - X2) % p
+    W1 = X1 * C % p
+    W2 = X2 * C % p
+    A1 = Y1 * (W1 - W2) % p
+    D  = Y1 - Y2
+    F  = Y1 + Y2
+    X3 = (D * D - W1 - W2) % p
+    Xd = (F * F - W1 - W2) % p
+    return X3, (D * (W1 - X3) - A1) % p, Xd, (F * (W1 - Xd) - A1) % p
+
+def ladder_scalar_mult(k, P):
+    """
+    k*P with a co-Z Montgomery ladder. k = 0, 1, n-2, n-1 (mod n) would
+    hit the point at infinity mid-ladder and go to jacobian_scalar_mult.
+    """
+    k %= n
+    if P is None or k in (0, 1, n - 2, n - 1):
+        return jacobian_scalar_mult(k, P)
+    k += n
+    k += n * (1 - (k >> 256))          # bit 256 set, without branching on k
+
+    # Initial doubling from Z = 1: R1 = 2P, R0 = P rescaled to R1's Z
+    x, y = P
+    E  = y * y % p
+    S  = 4 * x * E % p
+    M  = 3 * x * x % p
+    X1 = (M * M - 2 * S) % p
+    Y1 = (M * (S - X1) - 8 * E * E) % p
+    X0, Y0 = S, 8 * E * E % p
+
+    swap = 0
+    for i in range(255, -1, -1):
+        bit = (k >> i) & 1
+        X0, X1 = _cswap(bit ^ swap, X0, X1)
+        Y0, Y1 = _cswap(bit ^ swap, Y0, Y1)
+        swap = bit
+        # with (R0, R1) = (R_b, R_1-b): R_1-b <- R0 + R1, R_b <- 2 R_b
+        X1, Y1, X0, Y0 = _xycz_addc(X0, Y0, X1, Y1)
+        XD, YD, H = X0, Y0, X1 - X0     # R_b - R_1-b = (2b - 1) P
+        X0, Y0, X1, Y1 = _xycz_add(X1, Y1, X0, Y0)
+    X0, X1 = _cswap(swap, X0, X1)
+    Y0, Y1 = _cswap(swap, Y0, Y1)
+
+    # Z is never tracked: the last difference is +-P at Z' = YD x / (+-y XD),
+    # and the final add scaled Z' by H, so 1/Z = +-y XD / (YD x H).
+    z_inv = (2 * swap - 1) * y * XD * fe_inv(YD * x * H % p) % p
+    z_inv2 = z_inv * z_inv % p
+    return (X0 * z_inv2 % p, Y0 * z_inv2 * z_inv % p)
+
 # Choose between HW and SW scalar multiplication here:
 USE_HW = False  # Toggle this to True to use RTL version
 
+# Software strategy used by scalar_mult when USE_HW is False
+SW_STRATEGIES = {
+    "affine":   sw_scalar_mult,
+    "jacobian": jacobian_scalar_mult,
+    "wnaf":     wnaf_scalar_mult,
+    "glv":      glv_scalar_mult,
+    "ladder":   ladder_scalar_mult,
+}
+SW_STRATEGY = "glv"  # "affine" selects the original double-and-add
+
+# Multiples of the generator go through the precomputed table above
+USE_FIXED_BASE = True
+
+# verify() computes u1*G + u2*pub with double_scalar_mult
+USE_SHAMIR = True
+
+# sign() and gen_keypair() multiply by secrets with ladder_scalar_mult and
+# invert the nonce with a fixed exponent instead of pow(k, -1, n)
+CONSTANT_TIME = False
+
 def scalar_mult(k, P):
     if USE_HW:
         return hw_scalar_mult(k, P[0], P[1])
+    elif USE_FIXED_BASE and P == G:
+        return fixed_base_scalar_mult(k)
     else:
-        return sw_scalar_mult(k, P)
+        return SW_STRATEGIES[SW_STRATEGY](k, P)
+
+def secret_scalar_mult(k, P):
+    if CONSTANT_TIME and not USE_HW:
+        return ladder_scalar_mult(k, P)
+    return scalar_mult(k, P)
 
 def gen_keypair():
     priv = secrets.randbelow(n-1) + 1
-    pub  = scalar_mult(priv, G)
+    pub  = secret_scalar_mult(priv, G)
     assert is_on_curve(pub)
     return priv, pub
 
@@ -71,36 +676,277 @@ def sha256_int(msg: bytes) -> int:
     return int.from_bytes(hashlib.sha256(msg).digest(), 'big') % n
 
 def sign(msg: bytes, priv: int):
-    e = sha256_int(msg)
+    return _sign_digest(sha256_int(msg), priv)
+
+def verify(msg: bytes, sig: tuple, pub: tuple) -> bool:
+    return _verify_digest(sha256_int(msg), sig, pub)
+
+def _sign_digest(e: int, priv: int):
     while True:
         k = secrets.randbelow(n-1) + 1
-        x1, y1 = scalar_mult(k, G)
+        x1, y1 = secret_scalar_mult(k, G)
         r = x1 % n
         if r == 0:
             continue
-        s = (inv_mod(k, n) * (e + priv * r)) % n
+        k_inv = pow(k, n - 2, n) if CONSTANT_TIME else inv_mod(k, n)
+        s = (k_inv * (e + priv * r)) % n
         if s == 0:
             continue
         return (r, s)
 
-def verify(msg: bytes, sig: tuple, pub: tuple) -> bool:
+def _verify_digest(e: int, sig: tuple, pub: tuple) -> bool:
     r, s = sig
     if not (1 <= r < n and 1 <= s < n):
         return False
-    e = sha256_int(msg)
     w = inv_mod(s, n)
     u1 = (e * w) % n
     u2 = (r * w) % n
-    X = point_add(scalar_mult(u1, G), scalar_mult(u2, pub))
+    if USE_SHAMIR and not USE_HW:
+        X = double_scalar_mult(u1, G, u2, pub)
+    else:
+        X = point_add(scalar_mult(u1, G), scalar_mult(u2, pub))
     if X is None:
         return False
     x1, _ = X
     return (x1 % n) == r
 
+# ——— Streaming message hashing ———
+# Same digests as sign/verify on the concatenated bytes, but the message
+# can be a file object, an iterable of chunks, or a memory-mapped file,
+# so arbitrarily large inputs are hashed in constant memory.
+HASH_CHUNK_SIZE = 1 << 20  # bytes per read from file objects
+
+def sha256_int_stream(source) -> int:
+    h = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        h.update(source)
+    elif hasattr(source, "readinto"):
+        buf = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buf)
+        while True:
+            got = source.readinto(buf)
+            if not got:
+                break
+            h.update(view[:got])
+    elif hasattr(source, "read"):
+        for chunk in iter(lambda: source.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    else:
+        for chunk in source:
+            h.update(chunk)
+    return int.from_bytes(h.digest(), 'big') % n
+
+def sha256_int_file(path) -> int:
+    """Hash a file on disk through a read-only memory map (no copy)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return sha256_int(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return sha256_int_stream(mm)
+
+def sign_stream(source, priv: int):
+    return _sign_digest(sha256_int_stream(source), priv)
+
+def verify_stream(source, sig: tuple, pub: tuple) -> bool:
+    return _verify_digest(sha256_int_stream(source), sig, pub)
+
+def sign_file(path, priv: int):
+    return _sign_digest(sha256_int_file(path), priv)
+
+def verify_file(path, sig: tuple, pub: tuple) -> bool:
+    return _verify_digest(sha256_int_file(path), sig, pub)
+
+# ——— Batch verification ———
+def _jacobian_x_matches(J, r):
+    """
+    x(J) mod n == r without converting J to affine: X == r' * Z^2 for
+    r' = r or r + n (the latter only when it is still below p).
+    """
+    if J is None:
+        return False
+    X, _, Z = J
+    ZZ = (Z * Z) % p
+    if (r * ZZ - X) % p == 0:
+        return True
+    return r + n < p and ((r + n) * ZZ - X) % p == 0
+
+def verify_batch(items):
+    """
+    Verify an iterable of (msg, sig, pub) triples and return one bool per
+    item, in order, so callers can pick out exactly which ones failed.
+    Signatures with r or s out of range are rejected before any point
+    arithmetic. Each item still costs one full u1*G + u2*pub, so this is
+    about as fast as calling verify() in a loop: the shared s^-1 batch
+    inversion and the Jacobian x(R) check only save one inversion each.
+    Stepping all items through the ladder in lockstep with one inversion
+    mod p per round was tried and measured no faster under CPython.
+    """
+    items = list(items)
+    if USE_HW:
+        return [verify(msg, sig, pub) for msg, sig, pub in items]
+
+    results = [False] * len(items)
+    live = []
+    for idx, (msg, (r, s), pub) in enumerate(items):
+        if 1 <= r < n and 1 <= s < n:
+            live.append((idx, msg, r, s, pub))
+
+    ws = batch_inv_mod([s for _, _, _, s, _ in live], n)
+    tables = {}  # one PUB_TABLE_CACHE lookup per distinct pub
+    for (idx, msg, r, s, pub), w in zip(live, ws):
+        e = sha256_int(msg)
+        u1 = (e * w) % n
+        u2 = (r * w) % n
+        if pub not in tables:
+            tables[pub] = PUB_TABLE_CACHE.get(pub, SHAMIR_WINDOW)
+        J = _double_scalar_jacobian(u1, G, u2, pub, tables[pub])
+        results[idx] = _jacobian_x_matches(J, r)
+    return results
+
+# ——— Profiling hooks ———
+# Free when off: nothing is wrapped until profile_enable() rebinds the
+# module-level routines below to counting/timing wrappers (every caller in
+# this module looks them up by global name), and profile_disable() puts
+# the originals back. Names imported elsewhere with `from ECDSA import`
+# keep the unwrapped function. Field multiplications are inline `% p`, so
+# they are counted per call from each routine's multiplication count.
+#   ECDSA_PROFILE=1          enable at import
+#   ECDSA_PROFILE_SAMPLE=N   time every Nth call of the entry points (default 1)
+#   ECDSA_PROFILE_OUT=path   write profile_snapshot() as JSON at exit
+PROFILE_COUNTED = {
+    # name:               (category, field multiplications per call)
+    "jacobian_double":    ("doublings", 6),
+    "jacobian_add":       ("additions", 16),
+    "jacobian_add_mixed": ("additions", 11),
+    "_xycz_add":          ("additions", 6),
+    "_xycz_addc":         ("additions", 8),
+    "from_jacobian":      (None, 4),
+    "glv_endomorphism":   (None, 1),
+    "fe_inv":             ("field_inversions", 0),
+    "inv_mod":            ("scalar_inversions", 0),
+}
+PROFILE_TIMED = [
+    "scalar_mult", "fixed_base_scalar_mult", "double_scalar_mult",
+    "_double_scalar_jacobian", "sw_scalar_mult", "jacobian_scalar_mult",
+    "wnaf_scalar_mult", "glv_scalar_mult", "ladder_scalar_mult",
+    "_sign_digest", "_verify_digest", "verify_batch",
+]
+
+_profile_originals = {}
+_profile_calls     = {}
+_profile_timers    = {}
+
+def _count_calls(name, fn):
+    calls = _profile_calls
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        calls[name] = calls.get(name, 0) + 1
+        return fn(*args, **kwargs)
+    return wrapper
+
+def _count_point_add(fn):
+    calls = _profile_calls
+    @functools.wraps(fn)
+    def wrapper(P, Q):
+        name = "point_add.double" if P == Q else "point_add.add"
+        calls[name] = calls.get(name, 0) + 1
+        return fn(P, Q)
+    return wrapper
+
+def _count_batch_inv(fn):
+    calls = _profile_calls
+    @functools.wraps(fn)
+    def wrapper(values):
+        calls["fe_batch_inv"] = calls.get("fe_batch_inv", 0) + 1
+        calls["fe_batch_inv.elements"] = calls.get("fe_batch_inv.elements", 0) + len(values)
+        return fn(values)
+    return wrapper
+
+def _sample_timer(name, fn, every):
+    stats = _profile_timers.setdefault(name, {"calls": 0, "samples": 0,
+                                              "total_s": 0.0, "max_s": 0.0})
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        stats["calls"] += 1
+        if stats["calls"] % every:
+            return fn(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            dt = time.perf_counter() - start
+            stats["samples"] += 1
+            stats["total_s"] += dt
+            stats["max_s"] = max(stats["max_s"], dt)
+    return wrapper
+
+def profile_enable(sample_every=1):
+    """Install the counting/timing wrappers; sample_every=0 counts only."""
+    if _profile_originals:
+        return
+    g = globals()
+    wrapped = {name: _count_calls(name, g[name]) for name in PROFILE_COUNTED}
+    wrapped["point_add"]    = _count_point_add(g["point_add"])
+    wrapped["fe_batch_inv"] = _count_batch_inv(g["fe_batch_inv"])
+    if sample_every:
+        for name in PROFILE_TIMED:
+            wrapped[name] = _sample_timer(name, g[name], sample_every)
+    for name, fn in wrapped.items():
+        _profile_originals[name] = g[name]
+        g[name] = fn
+    _profile_originals["SW_STRATEGIES"] = dict(SW_STRATEGIES)
+    for key, fn in SW_STRATEGIES.items():
+        SW_STRATEGIES[key] = wrapped.get(fn.__name__, fn)
+
+def profile_disable():
+    """Restore the original, unwrapped routines (counters are kept)."""
+    g = globals()
+    strategies = _profile_originals.pop("SW_STRATEGIES", None)
+    if strategies is not None:
+        SW_STRATEGIES.update(strategies)
+    for name, fn in _profile_originals.items():
+        g[name] = fn
+    _profile_originals.clear()
+
+def profile_reset():
+    _profile_calls.clear()
+    for stats in _profile_timers.values():
+        stats.update(calls=0, samples=0, total_s=0.0, max_s=0.0)
+
+def profile_snapshot():
+    """Counters, derived totals and sampled timers as a JSON-ready dict."""
+    calls = dict(_profile_calls)
+    totals = {"field_mults": 0, "field_inversions": 0, "scalar_inversions": 0,
+              "doublings": 0, "additions": 0}
+    for name, (category, mults) in PROFILE_COUNTED.items():
+        count = calls.get(name, 0)
+        totals["field_mults"] += count * mults
+        if category:
+            totals[category] += count
+    adds, dbls = calls.get("point_add.add", 0), calls.get("point_add.double", 0)
+    totals["additions"]        += adds
+    totals["doublings"]        += dbls
+    totals["field_mults"]      += 3 * adds + 4 * dbls + 3 * calls.get("fe_batch_inv.elements", 0)
+    totals["field_inversions"] += calls.get("fe_batch_inv", 0)
+    timers = {name: dict(stats, mean_s=stats["total_s"] / stats["samples"] if stats["samples"] else 0.0)
+              for name, stats in _profile_timers.items() if stats["calls"]}
+    return {"enabled": bool(_profile_originals), "totals": totals,
+            "calls": calls, "timers": timers}
+
+def profile_dump(path):
+    with open(path, "w") as f:
+        json.dump(profile_snapshot(), f, indent=2)
+
+if os.environ.get("ECDSA_PROFILE") == "1":
+    profile_enable(int(os.environ.get("ECDSA_PROFILE_SAMPLE", "1")))
+    if os.environ.get("ECDSA_PROFILE_OUT"):
+        atexit.register(profile_dump, os.environ["ECDSA_PROFILE_OUT"])
+
 if __name__ == "__main__":
     priv, pub = gen_keypair()
-    msg = b"A" * (4096 * 4096)  # 4MB
+    # 16 MiB message streamed as 4 KiB chunks, never held in memory at once
+    chunks = lambda: (b"A" * 4096 for _ in range(4096))
 
-    sig = sign(msg, priv)
-    ok  = verify(msg, sig, pub)
-    print("Verified on 1MB message:", ok)
+    sig = sign_stream(chunks(), priv)
+    ok  = verify_stream(chunks(), sig, pub)
+    print("Verified on 16 MiB message:", ok)
@@ -0,0 +1,217 @@
+import argparse
+import json
+import os
+import platform
+import secrets
+import statistics
+import subprocess
+import sys
+import time
+
+import ECDSA
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, "..", "HW_SW_CoDesign", "sw"))
+
+# ——— Sweep configuration ———
+STRATEGIES   = ["affine", "jacobian", "wnaf", "glv", "ladder", "comb", "hw_model"]
+MSG_SIZES    = [64, 4096, 1 << 20]
+BATCH_SIZES  = [1, 16, 64, 256]
+WORKERS      = sorted({1, os.cpu_count() or 1})
+REPEATS      = 5            # timed rounds per configuration
+ROUND_TIME   = 0.25         # target seconds per round
+HW_CLOCK_MHZ = 100.0        # clock used to project hw_model cycles to ops/s
+HISTORY      = os.path.join(HERE, "ecdsa_bench_history.jsonl")
+
+# Two-sided 95% Student t quantiles by degrees of freedom
+_T95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+        8: 2.306, 9: 2.262, 10: 2.228, 15: 2.131, 20: 2.086, 30: 2.042}
+
+def t95(df):
+    usable = [d for d in _T95 if d <= df]
+    return _T95[max(usable)] if usable else _T95[1]
+
+# ——— Measurement ———
+def measure(fn, ops_per_call=1, repeats=None):
+    """
+    Run fn() in REPEATS rounds of a calibrated number of calls; returns
+    mean ops/s with a 95% confidence half-width over the rounds.
+    """
+    repeats = repeats or REPEATS
+    start = time.perf_counter()
+    fn()
+    single = max(time.perf_counter() - start, 1e-9)
+    calls = max(1, int(ROUND_TIME / single))
+
+    rates = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        rates.append(calls * ops_per_call / (time.perf_counter() - start))
+    mean = statistics.fmean(rates)
+    ci = t95(len(rates) - 1) * statistics.stdev(rates) / len(rates) ** 0.5 if len(rates) > 1 else 0.0
+    return {"ops_per_s": mean, "ci95": ci, "rounds": len(rates), "calls_per_round": calls}
+
+def _cycle(items):
+    i = 0
+    def next_item():
+        nonlocal i
+        i += 1
+        return items[i % len(items)]
+    return next_item
+
+# ——— Suites ———
+def bench_scalar(strategies, repeats):
+    """k*P per strategy; comb is k*G through the fixed-base table."""
+    _, P = ECDSA.gen_keypair()
+    scalars = _cycle([secrets.randbelow(ECDSA.n - 1) + 1 for _ in range(64)])
+    results = []
+    for name in strategies:
+        extra = {}
+        if name == "comb":
+            ECDSA.get_comb_table()
+            fn = lambda: ECDSA.fixed_base_scalar_mult(scalars())
+        elif name == "hw_model":
+            import hw_model
+            fn = lambda: hw_model.hw_scalar_mult(scalars(), *P)
+            _, _, _, perf = hw_model.MODEL.scalar_mul(scalars(), *P)
+            extra = {"model_cycles": perf["cycles"],
+                     "projected_ops_per_s": HW_CLOCK_MHZ * 1e6 / perf["cycles"]}
+        else:
+            mult = ECDSA.SW_STRATEGIES[name]
+            fn = lambda: mult(scalars(), P)
+        r = measure(fn, repeats=repeats if name != "hw_model" else 2)
+        results.append({"suite": "scalar_mult", "strategy": name, **r, **extra})
+    return results
+
+def bench_sign_verify(msg_sizes, repeats):
+    priv, pub = ECDSA.gen_keypair()
+    results = []
+    for size in msg_sizes:
+        msg = secrets.token_bytes(size)
+        sig = ECDSA.sign(msg, priv)
+        for op, fn in (("sign", lambda: ECDSA.sign(msg, priv)),
+                       ("verify", lambda: ECDSA.verify(msg, sig, pub))):
+            results.append({"suite": op, "msg_size": size, **measure(fn, repeats=repeats)})
+    return results
+
+def bench_batch(batch_sizes, repeats):
+    keys = [ECDSA.gen_keypair() for _ in range(8)]
+    items = []
+    for i in range(max(batch_sizes)):
+        priv, pub = keys[i % len(keys)]
+        msg = secrets.token_bytes(64)
+        items.append((msg, ECDSA.sign(msg, priv), pub))
+    results = []
+    for size in batch_sizes:
+        chunk = items[:size]
+        r = measure(lambda: ECDSA.verify_batch(chunk), ops_per_call=size, repeats=repeats)
+        results.append({"suite": "verify_batch", "batch_size": size, **r})
+    return results
+
+def bench_pool(worker_counts, repeats):
+    from ECDSA_pool import SignerPool, VerifierPool
+    priv, pub = ECDSA.gen_keypair()
+    msgs = [secrets.token_bytes(64) for _ in range(512)]
+    sigs = [ECDSA.sign(m, priv) for m in msgs]
+    items = list(zip(msgs, sigs, [pub] * len(msgs)))
+    results = []
+    for workers in worker_counts:
+        with SignerPool(workers) as signer, VerifierPool(workers) as verifier:
+            signer.sign_many(msgs[:workers], priv)            # start and warm workers
+            verifier.verify_many(items[:workers])
+            for op, fn in (("pool_sign", lambda: signer.sign_many(msgs, priv)),
+                           ("pool_verify", lambda: verifier.verify_many(items))):
+                r = measure(fn, ops_per_call=len(msgs), repeats=repeats)
+                results.append({"suite": op, "workers": workers, **r})
+    return results
+
+# ——— History ———
+KEY_FIELDS = ("suite", "strategy", "msg_size", "batch_size", "workers")
+
+def result_key(r):
+    return tuple(r.get(k) for k in KEY_FIELDS)
+
+def git_rev():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def load_previous(path):
+    """Most recent recorded result for every configuration key."""
+    previous = {}
+    if not os.path.exists(path):
+        return previous
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                for r in json.loads(line)["results"]:
+                    previous[result_key(r)] = r
+    return previous
+
+def append_history(path, results):
+    record = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_rev":   git_rev(),
+        "python":    platform.python_version(),
+        "machine":   platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "results":   results,
+    }
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+def print_results(results, previous):
+    print(f"{'suite':>13} | {'config':>18} | {'ops/s':>10} | {'±95%':>8} | {'vs last':>8} |")
+    print("-" * 72)
+    regressions = 0
+    for r in results:
+        config = ", ".join(f"{k}={r[k]}" for k in KEY_FIELDS[1:] if r.get(k) is not None)
+        line = f"{r['suite']:>13} | {config:>18} | {r['ops_per_s']:>10.1f} | {r['ci95']:>8.1f} |"
+        old = previous.get(result_key(r))
+        if old:
+            delta = r["ops_per_s"] / old["ops_per_s"] - 1
+            line += f" {delta:>+7.1%} |"
+            # flag only when the confidence intervals no longer overlap
+            if r["ops_per_s"] + r["ci95"] < old["ops_per_s"] - old["ci95"]:
+                line += " REGRESSION"
+                regressions += 1
+        else:
+            line += f" {'-':>8} |"
+        if "projected_ops_per_s" in r:
+            line += f" HW @ {HW_CLOCK_MHZ:g} MHz: {r['projected_ops_per_s']:.1f} ops/s"
+        print(line)
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ECDSA benchmark sweep with history")
+    parser.add_argument("--suites", nargs="+", default=["scalar", "sign_verify", "batch", "pool"],
+                        choices=["scalar", "sign_verify", "batch", "pool"])
+    parser.add_argument("--strategies", nargs="+", default=STRATEGIES, choices=STRATEGIES)
+    parser.add_argument("--msg-sizes", type=int, nargs="+", default=MSG_SIZES)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=BATCH_SIZES)
+    parser.add_argument("--workers", type=int, nargs="+", default=WORKERS)
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--history", default=HISTORY)
+    parser.add_argument("--no-record", action="store_true", help="compare only, do not append")
+    args = parser.parse_args()
+
+    results = []
+    if "scalar" in args.suites:
+        results += bench_scalar(args.strategies, args.repeats)
+    if "sign_verify" in args.suites:
+        results += bench_sign_verify(args.msg_sizes, args.repeats)
+    if "batch" in args.suites:
+        results += bench_batch(args.batch_sizes, args.repeats)
+    if "pool" in args.suites:
+        results += bench_pool(args.workers, args.repeats)
+
+    regressions = print_results(results, load_previous(args.history))
+    if not args.no_record:
+        append_history(args.history, results)
+        print(f"\nAppended to {args.history}")
+    if regressions:
+        raise SystemExit(f"{regressions} configuration(s) regressed")
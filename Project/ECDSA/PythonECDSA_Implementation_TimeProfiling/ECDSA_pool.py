@@ -0,0 +1,138 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import ECDSA
+
+# ——— Worker-side functions (run inside the pool processes) ———
+def _warm_worker():
+    """Build (or load, if ECDSA_COMB_TABLE is set) the G tables once per worker."""
+    ECDSA.get_comb_table()
+    ECDSA._base_table(ECDSA.G, ECDSA.GLV_WINDOW)
+
+def _sign_chunk(jobs):
+    start = time.perf_counter()
+    sigs = [ECDSA.sign(msg, priv) for msg, priv in jobs]
+    return os.getpid(), time.perf_counter() - start, sigs
+
+def _verify_chunk(items):
+    start = time.perf_counter()
+    ok = ECDSA.verify_batch(items)
+    return os.getpid(), time.perf_counter() - start, ok
+
+# ——— Host-side pools ———
+class _EcdsaPool:
+    """
+    Process pool that shards requests into chunks across workers. At most
+    max_pending chunks are in flight; further submissions block (or raise
+    queue.Full when block=False) until a worker frees a slot.
+    """
+    _task = None
+
+    def __init__(self, workers=None, max_pending=None, chunk_size=64):
+        self.workers    = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._slots     = threading.BoundedSemaphore(max_pending or 4 * self.workers)
+        self._lock      = threading.Lock()
+        self._per_pid   = {}
+        self._executor  = ProcessPoolExecutor(max_workers=self.workers,
+                                              initializer=_warm_worker)
+
+    def _submit_chunk(self, chunk, block=True, timeout=None):
+        if not self._slots.acquire(block, timeout):
+            raise queue.Full("ECDSA pool has max_pending chunks in flight")
+        try:
+            raw = self._executor.submit(type(self)._task, chunk)
+        except BaseException:
+            self._slots.release()
+            raise
+        out = Future()
+
+        def done(f):
+            self._slots.release()
+            if f.exception() is not None:
+                out.set_exception(f.exception())
+                return
+            pid, busy, results = f.result()
+            with self._lock:
+                ops, total = self._per_pid.get(pid, (0, 0.0))
+                self._per_pid[pid] = (ops + len(results), total + busy)
+            out.set_result(results)
+
+        raw.add_done_callback(done)
+        return out
+
+    def _map(self, jobs):
+        futures = [self._submit_chunk(jobs[i:i + self.chunk_size])
+                   for i in range(0, len(jobs), self.chunk_size)]
+        return [res for f in futures for res in f.result()]
+
+    def _submit_one(self, job, block, timeout):
+        out = Future()
+        chunk = self._submit_chunk([job], block, timeout)
+        chunk.add_done_callback(
+            lambda f: out.set_exception(f.exception()) if f.exception() is not None
+            else out.set_result(f.result()[0]))
+        return out
+
+    def stats(self):
+        """Per-worker ops, busy seconds and ops/s, keyed by worker pid."""
+        with self._lock:
+            return {
+                pid: {"ops": ops, "busy_s": busy, "ops_per_s": ops / busy if busy else 0.0}
+                for pid, (ops, busy) in self._per_pid.items()
+            }
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class SignerPool(_EcdsaPool):
+    _task = staticmethod(_sign_chunk)
+
+    def submit(self, msg: bytes, priv: int, block=True, timeout=None):
+        """Future resolving to the (r, s) signature of msg."""
+        return self._submit_one((msg, priv), block, timeout)
+
+    def sign_many(self, msgs, priv: int):
+        return self._map([(msg, priv) for msg in msgs])
+
+class VerifierPool(_EcdsaPool):
+    _task = staticmethod(_verify_chunk)
+
+    def submit(self, msg: bytes, sig: tuple, pub: tuple, block=True, timeout=None):
+        """Future resolving to True/False for one signature."""
+        return self._submit_one((msg, sig, pub), block, timeout)
+
+    def verify_many(self, items):
+        """One bool per (msg, sig, pub); each chunk goes through verify_batch."""
+        return self._map(list(items))
+
+if __name__ == "__main__":
+    NUM_MSGS = 2000
+    priv, pub = ECDSA.gen_keypair()
+    msgs = [os.urandom(64) for _ in range(NUM_MSGS)]
+
+    for workers in sorted({1, os.cpu_count() or 1}):
+        with SignerPool(workers) as signer, VerifierPool(workers) as verifier:
+            start = time.perf_counter()
+            sigs = signer.sign_many(msgs, priv)
+            t_sign = time.perf_counter() - start
+
+            start = time.perf_counter()
+            ok = verifier.verify_many(zip(msgs, sigs, [pub] * NUM_MSGS))
+            t_verify = time.perf_counter() - start
+            assert all(ok)
+
+            print(f"\n{workers} worker(s): sign {NUM_MSGS / t_sign:.1f}/s, "
+                  f"verify {NUM_MSGS / t_verify:.1f}/s")
+            for name, pool in (("sign", signer), ("verify", verifier)):
+                for pid, s in sorted(pool.stats().items()):
+                    print(f"  {name:6} pid {pid}: {s['ops']:5d} ops, {s['ops_per_s']:8.1f} ops/s")
@@ -0,0 +1,48 @@
+import secrets
+import timeit
+
+import secp256k1_field as F
+
+# ——— Per-operation cost of the GF(p) primitives ———
+NUMBER  = 2000   # calls per timing run
+REPEAT  = 5      # best of REPEAT runs is reported
+BATCHES = [16, 256]
+
+def euclid_inv(k):
+    """The extended-Euclid inv_mod that ecdsa_host.py used to carry."""
+    lm, low = 1, k % F.P
+    hm, high = 0, F.P
+    while low > 1:
+        r = high // low
+        lm, low, hm, high = hm - lm * r, high - low * r, lm, low
+    return lm % F.P
+
+def ns_per_op(stmt, env, number=NUMBER, ops=1):
+    best = min(timeit.repeat(stmt, globals=env, number=number, repeat=REPEAT))
+    return best / (number * ops) * 1e9
+
+if __name__ == "__main__":
+    a = secrets.randbelow(F.P - 1) + 1
+    b = secrets.randbelow(F.P - 1) + 1
+    env = {"F": F, "a": a, "b": b, "x": a * b, "P": F.P, "euclid_inv": euclid_inv}
+
+    rows = [
+        ("x % P",                  "x % P",                  NUMBER * 50),
+        ("fe_reduce_fold(x)",      "F.fe_reduce_fold(x)",    NUMBER * 50),
+        ("a * b % P (inline)",     "a * b % P",              NUMBER * 50),
+        ("fe_reduce_fold(a * b)",  "F.fe_reduce_fold(a * b)", NUMBER * 50),
+        ("fe_inv (pow -1)",        "F.fe_inv(a)",            NUMBER),
+        ("pow(a, P - 2, P)",       "pow(a, P - 2, P)",       NUMBER // 4),
+        ("fe_inv_chain",           "F.fe_inv_chain(a)",      NUMBER // 4),
+        ("fe_inv_bgcd",            "F.fe_inv_bgcd(a)",       NUMBER // 4),
+        ("extended Euclid",        "euclid_inv(a)",          NUMBER // 4),
+    ]
+    print(f"{'operation':>24} | {'ns/op':>10}")
+    print("-" * 37)
+    for name, stmt, number in rows:
+        print(f"{name:>24} | {ns_per_op(stmt, env, number):>10,.0f}")
+
+    for size in BATCHES:
+        env["vals"] = [secrets.randbelow(F.P - 1) + 1 for _ in range(size)]
+        t = ns_per_op("F.fe_batch_inv(vals)", env, NUMBER // size + 1, ops=size)
+        print(f"{'fe_batch_inv n=' + str(size):>24} | {t:>10,.0f}  (per element)")
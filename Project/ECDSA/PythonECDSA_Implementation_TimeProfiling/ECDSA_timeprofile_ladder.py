@@ -0,0 +1,62 @@
+import secrets
+import statistics
+import time
+
+import ECDSA
+
+# ——— Latency distribution: variable-time strategies vs the co-Z ladder ———
+NUM_SAMPLES = 300
+NUM_SIGNS   = 300
+
+def latencies(fn, args):
+    out = []
+    for a in args:
+        start = time.perf_counter()
+        fn(*a)
+        out.append(time.perf_counter() - start)
+    return out
+
+def summarize(samples):
+    s = sorted(samples)
+    pct = lambda q: s[min(len(s) - 1, int(q * len(s)))]
+    return {"mean": statistics.fmean(s), "p50": pct(0.50), "p99": pct(0.99),
+            "max": s[-1], "stdev": statistics.pstdev(s)}
+
+def print_row(name, samples):
+    r = summarize(samples)
+    print(f"{name:>22} | {r['mean'] * 1e3:>8.3f} | {r['p50'] * 1e3:>8.3f} | "
+          f"{r['p99'] * 1e3:>8.3f} | {r['max'] * 1e3:>8.3f} | {r['stdev'] / r['mean']:>6.1%}")
+
+def header(title):
+    print(f"\n{title}")
+    print(f"{'':>22} | {'mean ms':>8} | {'p50 ms':>8} | {'p99 ms':>8} | {'max ms':>8} | {'cv':>6}")
+    print("-" * 78)
+
+if __name__ == "__main__":
+    _, P = ECDSA.gen_keypair()
+    scalars = [secrets.randbelow(ECDSA.n - 1) + 1 for _ in range(NUM_SAMPLES)]
+    # Extreme Hamming weights expose data-dependent work
+    sparse = [(1 << 255) | (1 << secrets.randbelow(255)) for _ in range(NUM_SAMPLES)]
+    dense  = [((1 << 256) - 1) ^ (1 << secrets.randbelow(255)) for _ in range(NUM_SAMPLES)]
+    ECDSA.fixed_base_scalar_mult(1)  # build the G table outside the timings
+
+    header("k*P, random k")
+    for name in ("jacobian", "wnaf", "glv", "ladder"):
+        fn = ECDSA.SW_STRATEGIES[name]
+        print_row(name, latencies(fn, [(k, P) for k in scalars]))
+    print_row("fixed-base k*G", latencies(ECDSA.fixed_base_scalar_mult, [(k,) for k in scalars]))
+    print_row("ladder k*G", latencies(ECDSA.ladder_scalar_mult, [(k, ECDSA.G) for k in scalars]))
+
+    header("k*P, sparse vs dense k")
+    for name in ("jacobian", "ladder"):
+        fn = ECDSA.SW_STRATEGIES[name]
+        print_row(name + " sparse", latencies(fn, [(k, P) for k in sparse]))
+        print_row(name + " dense", latencies(fn, [(k, P) for k in dense]))
+
+    header("sign()")
+    priv, _ = ECDSA.gen_keypair()
+    msgs = [secrets.token_bytes(64) for _ in range(NUM_SIGNS)]
+    for constant_time in (False, True):
+        ECDSA.CONSTANT_TIME = constant_time
+        name = "CONSTANT_TIME=" + str(constant_time)
+        print_row(name, latencies(ECDSA.sign, [(m, priv) for m in msgs]))
@@ -0,0 +1,33 @@
+import secrets
+import time
+
+import ECDSA
+
+# ——— Compare binary double-and-add against wNAF for w = 2..6 ———
+NUM_SCALARS = 200
+WINDOWS     = [2, 3, 4, 5, 6]
+
+def time_per_scalar(fn, scalars, P):
+    start = time.perf_counter()
+    for k in scalars:
+        fn(k, P)
+    return (time.perf_counter() - start) / len(scalars)
+
+if __name__ == "__main__":
+    scalars = [secrets.randbelow(ECDSA.n - 1) + 1 for _ in range(NUM_SCALARS)]
+    _, P = ECDSA.gen_keypair()  # variable base, so no fixed-base table
+
+    print(f"{'strategy':>10} | {'table':>5} | {'adds/scalar':>11} | {'dbls/scalar':>11} | {'ms/scalar':>9}")
+    print("-" * 60)
+
+    adds = sum(bin(k).count("1") for k in scalars) / NUM_SCALARS
+    dbls = sum(k.bit_length() for k in scalars) / NUM_SCALARS
+    t = time_per_scalar(ECDSA.jacobian_scalar_mult, scalars, P)
+    print(f"{'binary':>10} | {1:>5} | {adds:>11.1f} | {dbls:>11.1f} | {t * 1e3:>9.3f}")
+
+    for w in WINDOWS:
+        recoded = [ECDSA.wnaf_digits(k, w) for k in scalars]
+        adds = sum(sum(1 for d in digits if d) for digits in recoded) / NUM_SCALARS
+        dbls = sum(len(digits) for digits in recoded) / NUM_SCALARS
+        t = time_per_scalar(lambda k, P: ECDSA.wnaf_scalar_mult(k, P, w), scalars, P)
+        print(f"{'wnaf w=' + str(w):>10} | {1 << (w - 2):>5} | {adds:>11.1f} | {dbls:>11.1f} | {t * 1e3:>9.3f}")
@@ -0,0 +1,83 @@
+# ——— secp256k1 base field GF(p), p = 2^256 - 2^32 - 977 ———
+# Under CPython a 512-bit `% P` is one C-level division and beats the
+# pseudo-Mersenne fold written out in Python, and pow(a, -1, P) beats any
+# Python-level inversion; ECDSA_timeprofile_field.py measures all of
+# them. The point formulas in ECDSA.py therefore keep their inline
+# `a * b % p` (a helper call per multiplication only adds overhead) and
+# take just fe_inv/fe_batch_inv from here; the fold, the addition chain
+# and the binary GCD stay as reference versions.
+P         = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+P_C       = (1 << 32) + 977      # 2^256 = P_C (mod P)
+MASK256   = (1 << 256) - 1
+
+def fe_reduce_fold(x):
+    """Pseudo-Mersenne reduction of 0 <= x < 2^512: fold the top half twice."""
+    x = (x & MASK256) + (x >> 256) * P_C
+    x = (x & MASK256) + (x >> 256) * P_C
+    return x - P if x >= P else x
+
+def fe_inv(a):
+    return pow(a, -1, P)
+
+def _sqr_n(x, k):
+    for _ in range(k):
+        x = x * x % P
+    return x
+
+def fe_inv_chain(a):
+    """a^(p-2) with the libsecp256k1 addition chain: 255 squarings, 15 mults."""
+    x2   = _sqr_n(a, 1) * a % P
+    x3   = _sqr_n(x2, 1) * a % P
+    x6   = _sqr_n(x3, 3) * x3 % P
+    x9   = _sqr_n(x6, 3) * x3 % P
+    x11  = _sqr_n(x9, 2) * x2 % P
+    x22  = _sqr_n(x11, 11) * x11 % P
+    x44  = _sqr_n(x22, 22) * x22 % P
+    x88  = _sqr_n(x44, 44) * x44 % P
+    x176 = _sqr_n(x88, 88) * x88 % P
+    x220 = _sqr_n(x176, 44) * x44 % P
+    x223 = _sqr_n(x220, 3) * x3 % P
+    t = _sqr_n(x223, 23) * x22 % P
+    t = _sqr_n(t, 5) * a % P
+    t = _sqr_n(t, 3) * x2 % P
+    return _sqr_n(t, 2) * a % P
+
+def fe_inv_bgcd(a):
+    """Binary extended GCD: shifts and subtractions only."""
+    u, v = a % P, P
+    if u == 0:
+        raise ZeroDivisionError("division by zero")
+    x1, x2 = 1, 0
+    while u != 1 and v != 1:
+        while not u & 1:
+            u >>= 1
+            x1 = x1 >> 1 if not x1 & 1 else (x1 + P) >> 1
+        while not v & 1:
+            v >>= 1
+            x2 = x2 >> 1 if not x2 & 1 else (x2 + P) >> 1
+        if u >= v:
+            u -= v
+            x1 -= x2
+        else:
+            v -= u
+            x2 -= x1
+    return (x1 if u == 1 else x2) % P
+
+def fe_batch_inv(values):
+    """
+    Montgomery's trick: every (non-zero) inverse for one fe_inv and three
+    multiplications per element.
+    """
+    prefix = []
+    acc = 1
+    for v in values:
+        acc = acc * v % P
+        prefix.append(acc)
+    inv = fe_inv(acc) if values else 1
+    out = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        out[i] = inv * prefix[i - 1] % P
+        inv = inv * values[i] % P
+    if values:
+        out[0] = inv
+    return out